@@ -3,12 +3,49 @@ SQLite 데이터베이스 관리 모듈
 SAP 기업정보 저장 및 조회
 """
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 # 데이터베이스 파일 경로
 DB_PATH = Path("data/TestDB.sqlite")
 
+# 기업 목록/정보 조회 캐시 (sap 테이블은 자주 읽고 드물게 씀)
+# - sap 테이블을 수정하는 함수는 반드시 _invalidate_company_cache() 호출
+# - 초기화마다 세대 번호를 올리고, 조회 결과는 조회 시작 때와 세대가 같을 때만 저장
+#   (조회 도중 다른 쓰레드에서 초기화되면 이전 값이 다시 캐시되지 않도록)
+_companies_cache: Optional[List[str]] = None
+_companies_with_code_cache: Optional[List[Dict[str, str]]] = None
+_company_info_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+_COMPANY_INFO_CACHE_SIZE = 64
+_companies_cache_gen = 0
+_companies_cache_lock = threading.Lock()
+
+# rule 테이블별 규칙 목록 캐시 (기업 선택 때마다 다시 읽지 않도록)
+# - rule 테이블을 수정하는 함수는 반드시 _invalidate_rules_cache(rule_table_name) 호출
+# - 세대 번호 사용 방식은 기업 캐시와 같음
+_rules_cache: Dict[str, List[Dict[str, Any]]] = {}
+_rules_cache_gen = 0
+_rules_cache_lock = threading.Lock()
+
+
+def _invalidate_company_cache():
+    """기업 목록/정보 캐시 초기화 (sap 테이블 변경 후 호출)"""
+    global _companies_cache, _companies_with_code_cache, _companies_cache_gen
+    with _companies_cache_lock:
+        _companies_cache_gen += 1
+        _companies_cache = None
+        _companies_with_code_cache = None
+        _company_info_cache.clear()
+
+
+def _invalidate_rules_cache(rule_table_name: str):
+    """규칙 목록 캐시 초기화 (rule 테이블 변경 후 호출)"""
+    global _rules_cache_gen
+    with _rules_cache_lock:
+        _rules_cache_gen += 1
+        _rules_cache.pop(rule_table_name, None)
+
 
 def init_database():
     """데이터베이스 초기화 (테이블은 이미 존재하므로 연결만 확인)"""
@@ -30,6 +67,24 @@ def get_company_info(sap_code_or_name: str) -> Optional[Dict[str, Any]]:
     Returns:
         기업정보 딕셔너리 (기존 코드 호환을 위해 필드명 변환)
     """
+    with _companies_cache_lock:
+        gen = _companies_cache_gen
+        cached = sap_code_or_name in _company_info_cache
+        info = _company_info_cache.get(sap_code_or_name)
+    if not cached:
+        info = _load_company_info(sap_code_or_name)
+        with _companies_cache_lock:
+            if gen == _companies_cache_gen:
+                if len(_company_info_cache) >= _COMPANY_INFO_CACHE_SIZE:
+                    # 가장 먼저 넣은 항목 제거
+                    del _company_info_cache[next(iter(_company_info_cache))]
+                _company_info_cache[sap_code_or_name] = info
+    # 캐시된 딕셔너리를 호출부에서 수정해도 캐시가 오염되지 않도록 복사본 반환
+    return dict(info) if info else None
+
+
+def _load_company_info(sap_code_or_name: str) -> Optional[Dict[str, Any]]:
+    """get_company_info 실제 조회 (캐시는 get_company_info에서 관리)"""
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
@@ -71,6 +126,12 @@ def get_company_info(sap_code_or_name: str) -> Optional[Dict[str, Any]]:
 
 def get_all_companies() -> List[str]:
     """모든 SAP 기업명 목록 조회 (sap_name 반환)"""
+    global _companies_cache
+    with _companies_cache_lock:
+        if _companies_cache is not None:
+            return list(_companies_cache)
+        gen = _companies_cache_gen
+
     conn = sqlite3.connect(str(DB_PATH))
     cursor = conn.cursor()
     
@@ -78,11 +139,21 @@ def get_all_companies() -> List[str]:
     rows = cursor.fetchall()
     conn.close()
     
-    return [row[0] for row in rows] if rows else []
+    names = [row[0] for row in rows] if rows else []
+    with _companies_cache_lock:
+        if gen == _companies_cache_gen:
+            _companies_cache = names
+    return list(names)
 
 
 def get_all_companies_with_code() -> List[Dict[str, str]]:
     """모든 SAP 기업 정보 조회 (sap_code와 sap_name 반환)"""
+    global _companies_with_code_cache
+    with _companies_cache_lock:
+        if _companies_with_code_cache is not None:
+            return [dict(c) for c in _companies_with_code_cache]
+        gen = _companies_cache_gen
+
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
@@ -91,7 +162,11 @@ def get_all_companies_with_code() -> List[Dict[str, str]]:
     rows = cursor.fetchall()
     conn.close()
     
-    return [{"sap_code": row["sap_code"], "sap_name": row["sap_name"]} for row in rows] if rows else []
+    companies = [{"sap_code": row["sap_code"], "sap_name": row["sap_name"]} for row in rows] if rows else []
+    with _companies_cache_lock:
+        if gen == _companies_cache_gen:
+            _companies_with_code_cache = companies
+    return [dict(c) for c in companies]
 
 
 def get_rules_from_table(rule_table_name: str) -> List[Dict[str, Any]]:
@@ -106,6 +181,13 @@ def get_rules_from_table(rule_table_name: str) -> List[Dict[str, Any]]:
     """
     if not rule_table_name:
         return []
+
+    with _rules_cache_lock:
+        cached = _rules_cache.get(rule_table_name)
+        gen = _rules_cache_gen
+    if cached is not None:
+        # 호출부에서 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return [dict(rule) for rule in cached]
     
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
@@ -125,7 +207,11 @@ def get_rules_from_table(rule_table_name: str) -> List[Dict[str, Any]]:
         rows = cursor.fetchall()
         conn.close()
         
-        return [dict(row) for row in rows] if rows else []
+        rules = [dict(row) for row in rows] if rows else []
+        with _rules_cache_lock:
+            if gen == _rules_cache_gen:
+                _rules_cache[rule_table_name] = rules
+        return [dict(rule) for rule in rules]
     except sqlite3.OperationalError:
         # 테이블이 없으면 빈 리스트 반환
         conn.close()
@@ -192,6 +278,7 @@ def create_rule_table(rule_table_name: str, cursor=None) -> bool:
         if not use_existing_cursor:
             conn.commit()
             conn.close()
+        _invalidate_rules_cache(rule_table_name)
         return True
     except sqlite3.Error as e:
         if not use_existing_cursor:
@@ -276,6 +363,7 @@ def upsert_company(sap_code: str, sap_name: str = None, warranty_mileage: int =
     
     conn.commit()
     conn.close()
+    _invalidate_company_cache()
 
 
 def update_company_remark(sap_code: str, remark: str) -> bool:
@@ -301,6 +389,7 @@ def update_company_remark(sap_code: str, remark: str) -> bool:
         
         conn.commit()
         conn.close()
+        _invalidate_company_cache()
         return cursor.rowcount > 0
     except sqlite3.OperationalError as e:
         conn.close()
@@ -447,6 +536,7 @@ def add_rule_to_table(
         rule_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        _invalidate_rules_cache(rule_table_name)
         
         return rule_id
     except sqlite3.OperationalError as e:
@@ -554,6 +644,7 @@ def update_rule_in_table(
         
         conn.commit()
         conn.close()
+        _invalidate_rules_cache(rule_table_name)
         return cursor.rowcount > 0
     except sqlite3.OperationalError as e:
         conn.close()
@@ -591,6 +682,7 @@ def update_rule_priorities(rule_table_name: str, rule_ids_in_order: List[int]) -
         
         conn.commit()
         conn.close()
+        _invalidate_rules_cache(rule_table_name)
         return True
     except sqlite3.Error as e:
         conn.rollback()
@@ -619,6 +711,7 @@ def delete_rule_from_table(rule_table_name: str, rule_id: int) -> bool:
         
         conn.commit()
         conn.close()
+        _invalidate_rules_cache(rule_table_name)
         return cursor.rowcount > 0
     except sqlite3.OperationalError as e:
         conn.close()
@@ -5,7 +5,7 @@ from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout,
     QPushButton, QComboBox, QLineEdit, QLabel, QCheckBox, QCompleter, QSizePolicy
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QStringListModel
 
 
 class ControlPanel(QWidget):
@@ -32,6 +32,9 @@ class ControlPanel(QWidget):
         # 시트 선택
         top_row.addWidget(QLabel("시트:"))
         self.sheet_combo = QComboBox()
+        # 시트 목록은 모델 1개로 유지하고 set_sheet_names로 한 번에 교체
+        self._sheet_model = QStringListModel(self)
+        self.sheet_combo.setModel(self._sheet_model)
         self.sheet_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         top_row.addWidget(self.sheet_combo, 1)  # stretch factor 1
         
@@ -39,10 +42,14 @@ class ControlPanel(QWidget):
         top_row.addWidget(QLabel("COMEX 불러오기:"))
         self.company_edit = QLineEdit()
         self.company_edit.setPlaceholderText("협력사 검색 (이름 또는 코드)")
-        # QCompleter 설정
-        self.company_completer = QCompleter()
+        # QCompleter 설정 (모델은 1개만 만들어 두고 set_companies로 목록만 교체)
+        # - 코드는 "이름 (코드)"의 중간에 있으므로 MatchContains 유지
+        self._company_model = QStringListModel(self)
+        self.company_completer = QCompleter(self)
+        self.company_completer.setModel(self._company_model)
         self.company_completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.company_completer.setFilterMode(Qt.MatchContains)
+        self.company_completer.setCompletionMode(QCompleter.PopupCompletion)
         self.company_edit.setCompleter(self.company_completer)
         self.company_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         top_row.addWidget(self.company_edit, 1)  # stretch factor 1 (시트와 동일)
@@ -116,10 +123,29 @@ class ControlPanel(QWidget):
         """기업 선택 자동완성 반환"""
         return self.company_completer
     
+    def set_companies(self, names: list[str]):
+        """기업 자동완성 목록 설정 (정렬해서 1회 반영, 목록이 같으면 모델 유지)"""
+        names = sorted(names, key=str.lower)
+        if names == self._company_model.stringList():
+            return
+        self._company_model.setStringList(names)
+    
     def get_sheet_combo(self) -> QComboBox:
         """시트 선택 콤보박스 반환"""
         return self.sheet_combo
     
+    def set_sheet_names(self, names: list[str]):
+        """
+        시트 콤보박스 목록 설정
+        - 목록이 같으면 모델 유지
+        - 항목별 추가 대신 setStringList 1회로 교체 (currentTextChanged는 발생하지 않음)
+        """
+        if names == self._sheet_model.stringList():
+            return
+        self.sheet_combo.blockSignals(True)
+        self._sheet_model.setStringList(names)
+        self.sheet_combo.blockSignals(False)
+    
     def get_search_edit(self) -> QLineEdit:
         """검색 입력창 반환"""
         return self.search_edit
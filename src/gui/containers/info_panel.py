@@ -1,10 +1,130 @@
-from PySide6.QtCore import Qt
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QGroupBox, QLabel, QTextEdit, QPushButton,
-    QScrollArea
+    QGroupBox, QLabel, QPlainTextEdit, QPushButton, QMessageBox,
+    QListView, QAbstractItemView
 )
 from src.database import update_company_remark
+from src.gui.workers import WorkerThread
+
+
+# 패널 전체 스타일 (위젯마다 setStyleSheet하지 않고 패널에 1회만 적용, objectName으로 구분)
+# - Rule 목록 상태별 색은 RuleListModel의 ForegroundRole로 지정
+_INFO_PANEL_STYLE = """
+QGroupBox#infoGroup { padding-top: 10px; }
+#infoHeader, #infoHeader * { background: transparent; }
+QLabel#comexTitle { font-size: 12pt; color: black; font-weight: bold; }
+QLabel#companyHeader { font-size: 12pt; color: black; font-weight: normal; }
+#ruleCard, #ruleCard *, #remarkCard, #remarkCard * { background: #FAFAFA; }
+QLabel#cardTitle { font-weight: bold; font-size: 10pt; color: #555; }
+QListView#ruleList { border: none; background: #FAFAFA; font-size: 10pt; }
+"""
+
+
+# ---------- Rule 변경 내용 표시 ----------
+# _format_rule_changes가 읽는 필드 (캐시 키 순서)
+_RULE_CHANGE_FIELDS = (
+    "repair_region", "project_code", "exclude_project_code", "vehicle_classification",
+    "part_name", "part_no", "engine_form", "liability_ratio",
+    "warranty_mileage_override", "warranty_period_override",
+    "amount_cap_value", "amount_cap_type", "valid_from", "valid_to",
+)
+
+
+def _valid(val, ignore=frozenset({"ALL", "NONE"})) -> bool:
+    """표시할 만한 조건 값인지 (비어 있거나 ALL/NONE이면 제외)"""
+    return bool(val) and str(val).strip().upper() not in ignore
+
+
+# 문자열 조건 필드 (키, 표시명, 표시 여부 판단) - 표시 순서대로
+_RULE_TEXT_FIELDS = (
+    ("repair_region", "수리지역", _valid),
+    ("project_code", "프로젝트", _valid),
+    ("exclude_project_code", "제외", bool),
+    ("vehicle_classification", "차계", _valid),
+    ("part_name", "부품", _valid),
+    ("part_no", "부품번호", _valid),
+    ("engine_form", "엔진", _valid),
+)
+# 적용 기간 필드 (키, 표시명) - 맨 뒤에 표시
+_RULE_DATE_FIELDS = (
+    ("valid_from", "시작일"),
+    ("valid_to", "종료일"),
+)
+
+
+# dialogs.py 의 format_rule_changes 로직 그대로
+# - 같은 규칙을 기업 선택 때마다 다시 조합하지 않도록 필드 값 튜플 기준으로 캐시
+# - typed=True: 1과 1.0(구상율 등)은 표시가 다르므로 따로 캐시 (값마다 타입 구분되도록 개별 인자로 받음)
+@lru_cache(maxsize=1024, typed=True)
+def _format_rule_changes_cached(*values) -> str:
+    rule = dict(zip(_RULE_CHANGE_FIELDS, values))
+    changes = [
+        f"{label}: {rule[key]}"
+        for key, label, is_shown in _RULE_TEXT_FIELDS
+        if is_shown(rule[key])
+    ]
+
+    if rule["liability_ratio"] is not None:
+        changes.append(f"구상율: {rule['liability_ratio']}%")
+    if rule["warranty_mileage_override"] is not None:
+        changes.append(f"주행거리: {rule['warranty_mileage_override']}km")
+    if rule["warranty_period_override"] is not None:
+        years = rule["warranty_period_override"] / 365.0
+        changes.append(f"보증기간: {years:.1f}년")
+    if rule["amount_cap_value"] is not None and _valid(rule["amount_cap_type"]):
+        changes.append(f"상한: {rule['amount_cap_value']} ({rule['amount_cap_type']})")
+    changes.extend(f"{label}: {rule[key]}" for key, label in _RULE_DATE_FIELDS if rule[key])
+
+    return " | ".join(changes) if changes else "기본 규칙"
+
+
+class RuleListModel(QAbstractListModel):
+    """
+    InfoPanel Rule 목록 모델
+    - 규칙마다 QLabel을 만들지 않고 QListView가 보이는 행만 그림
+    - 규칙이 없으면 "등록된 Rule 없음" 1행 표시
+    """
+    _EMPTY_TEXT = "등록된 Rule 없음"
+    # 상태별 글자색 (1회 생성)
+    _BRUSHES = {
+        "ACTIVE": QBrush(QColor("#2E7D32")),
+        "INACTIVE": QBrush(QColor("#888888")),
+        "": QBrush(QColor("#999999")),  # 빈 목록 안내
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, str]] = []  # (표시 텍스트, 상태 대문자)
+
+    def set_rows(self, rows: list[tuple[str, str]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) or 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if not self._rows:
+            if role == Qt.DisplayRole:
+                return self._EMPTY_TEXT
+            if role == Qt.ForegroundRole:
+                return self._BRUSHES[""]
+            return None
+        text, status = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return self._BRUSHES.get(status)
+        return None
 
 
 class InfoPanel(QWidget):
@@ -17,6 +137,10 @@ class InfoPanel(QWidget):
 
         self.current_sap_code: str | None = None
         self.original_remark: str = ""
+        # 원본 Remark 길이 (QTextDocument와 같은 UTF-16 단위) - 길이가 다르면 문자열 비교 생략
+        self._original_remark_len: int = 0
+
+        self.setStyleSheet(_INFO_PANEL_STYLE)
 
         # ===== 외부 레이아웃 =====
         outer_layout = QVBoxLayout(self)
@@ -25,12 +149,7 @@ class InfoPanel(QWidget):
         # ===== GroupBox =====
         # GroupBox 제목을 빈 문자열로 설정하고, 커스텀 헤더 사용
         info_group = QGroupBox("")
-        info_group.setStyleSheet("""
-            QGroupBox {
-
-                padding-top: 10px;
-            }
-        """)
+        info_group.setObjectName("infoGroup")
         
         # GroupBox 내부 전체 레이아웃
         group_inner_layout = QVBoxLayout()
@@ -39,18 +158,18 @@ class InfoPanel(QWidget):
         
         # COMEX 제목과 기업명을 표시할 헤더 위젯 (GroupBox 내부 상단)
         header_widget = QWidget()
-        header_widget.setStyleSheet("background: transparent;")
+        header_widget.setObjectName("infoHeader")
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(4, 0, 4, 0)
         header_layout.setSpacing(10)
         
         # COMEX 레이블
         lbl_comx = QLabel("COMEX")
-        lbl_comx.setStyleSheet("font-size: 12pt; color: black; font-weight: bold;")
+        lbl_comx.setObjectName("comexTitle")
         
         # 기업명 표시 레이블 (초기에는 숨김)
         self.lbl_company_header = QLabel("")
-        self.lbl_company_header.setStyleSheet("font-size: 12pt; color: black; font-weight: normal;")
+        self.lbl_company_header.setObjectName("companyHeader")
         
         header_layout.addWidget(lbl_comx)
         header_layout.addWidget(self.lbl_company_header)
@@ -64,41 +183,35 @@ class InfoPanel(QWidget):
 
         # ================= Rule 카드 =================
         rule_card = QWidget()
-        rule_card.setStyleSheet("background: #FAFAFA;")
+        rule_card.setObjectName("ruleCard")
         rule_card_layout = QVBoxLayout(rule_card)
         rule_card_layout.setContentsMargins(4, 8, 4, 8)
         rule_card_layout.setSpacing(6)
 
         # 1) 적용 규칙 텍스트 - 상단
         lbl_rule_title = QLabel("적용 규칙")
-        lbl_rule_title.setStyleSheet("font-weight: bold; font-size: 10pt; color: #555;")
+        lbl_rule_title.setObjectName("cardTitle")
         rule_card_layout.addWidget(lbl_rule_title)
 
-        # 2) Rule 목록을 스크롤 가능한 영역으로 만들기
-        rule_scroll = QScrollArea()
-        rule_scroll.setWidgetResizable(True)
-        rule_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        rule_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        rule_scroll.setStyleSheet("QScrollArea { border: none; background: #FAFAFA; }")
-        
-        rule_content = QWidget()
-        rule_layout = QVBoxLayout(rule_content)
-        rule_layout.setContentsMargins(0, 0, 0, 0)
-        rule_layout.setSpacing(4)
-        
-        # Rule 목록 레이아웃 (기업명은 COMEX 우측에 표시되므로 제거)
-        self.rule_list_layout = QVBoxLayout()
-        self.rule_list_layout.setContentsMargins(0, 0, 0, 0)
-        self.rule_list_layout.setSpacing(4)
-        rule_layout.addLayout(self.rule_list_layout)
-        rule_layout.addStretch()
-        
-        rule_scroll.setWidget(rule_content)
-        rule_card_layout.addWidget(rule_scroll)
+        # 2) Rule 목록 (모델/뷰: 규칙 수와 무관하게 보이는 행만 그림, 줄바꿈 표시)
+        self.rule_model = RuleListModel(self)
+        self.rule_view = QListView()
+        self.rule_view.setObjectName("ruleList")
+        self.rule_view.setModel(self.rule_model)
+        self.rule_view.setWordWrap(True)
+        self.rule_view.setResizeMode(QListView.Adjust)
+        self.rule_view.setSpacing(2)
+        self.rule_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.rule_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.rule_view.setFocusPolicy(Qt.NoFocus)
+        self.rule_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.rule_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.rule_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        rule_card_layout.addWidget(self.rule_view)
 
         # ================= Remark 카드 =================
         remark_card = QWidget()
-        remark_card.setStyleSheet("background: #FAFAFA;")
+        remark_card.setObjectName("remarkCard")
         remark_layout = QVBoxLayout(remark_card)
         remark_layout.setContentsMargins(4, 8, 4, 8)
         remark_layout.setSpacing(6)
@@ -110,7 +223,7 @@ class InfoPanel(QWidget):
         remark_title_layout.setSpacing(0)
         
         lbl_remark_title = QLabel("비고(Remark)")
-        lbl_remark_title.setStyleSheet("font-weight: bold; font-size: 10pt; color: #555;")
+        lbl_remark_title.setObjectName("cardTitle")
         remark_title_layout.addWidget(lbl_remark_title)
         remark_title_layout.addStretch()
         
@@ -127,7 +240,7 @@ class InfoPanel(QWidget):
         # 빈 공간 제거 (기업명 레이블이 없으므로 불필요)
         
         # Remark 텍스트 영역 (동적으로 크기 조정)
-        self.remark_text = QTextEdit()
+        self.remark_text = QPlainTextEdit()
         # 고정 높이 제거하여 정보 섹션이 움직일 때 따라가도록 함
         remark_layout.addWidget(self.remark_text)
         remark_layout.addStretch()  # 하단 여백 추가
@@ -143,8 +256,21 @@ class InfoPanel(QWidget):
         
         outer_layout.addWidget(info_group)
 
-        # ===== 이벤트 연결 =====
+        # Remark 변경 여부 확인은 입력이 멈춘 뒤 1회만 (키 입력마다 전체 텍스트 복사/비교 방지)
+        self._remark_dirty_timer = QTimer(self)
+        self._remark_dirty_timer.setSingleShot(True)
+        self._remark_dirty_timer.setInterval(120)
+        # 마지막으로 비교한 문서 revision (그 사이 변경이 없으면 비교 생략)
+        self._checked_revision: int = -1
+        # Remark 저장 워커 (저장 중에는 저장 버튼을 다시 켜지 않음)
+        self._save_worker: WorkerThread | None = None
+
+        self._connect_signals()
+
+    # ===== 이벤트 연결 =====
+    def _connect_signals(self):
         self.remark_text.textChanged.connect(self._on_remark_changed)
+        self._remark_dirty_timer.timeout.connect(self._recompute_remark_dirty)
         self.btn_save_remark.clicked.connect(self._on_save_remark)
 
     # ================= 외부 호출용 =================
@@ -161,95 +287,95 @@ class InfoPanel(QWidget):
 
     def set_remark(self, remark: str):
         """main_page에서 회사 선택 시 호출"""
-        self.original_remark = remark or ""
-        self.remark_text.setText(self.original_remark)
+        self._set_original_remark(remark or "")
+        # 프로그램에서 채우는 값은 편집이 아니므로 textChanged(변경 여부 재계산)를 막음
+        self.remark_text.blockSignals(True)
+        self.remark_text.setPlainText(self.original_remark)
+        self.remark_text.blockSignals(False)
+        self._remark_dirty_timer.stop()
         self.btn_save_remark.setEnabled(False)
 
     def set_rules(self, rules: list[dict]):
         """기업 선택 시 Rule 목록 표시"""
-        self._clear_rule_list()
-
-        if not rules:
-            lbl = QLabel("등록된 Rule 없음")
-            lbl.setStyleSheet("color: #999; font-size: 10pt;")
-            self.rule_list_layout.addWidget(lbl)
-            return
-
         # 우선순위 오름차순 정렬
-        sorted_rules = sorted(rules, key=lambda r: r.get("priority", 999))
+        sorted_rules = sorted(rules or [], key=lambda r: r.get("priority", 999))
+        rows = []
         for rule in sorted_rules:
             status = rule.get("status", "")
             changes = self._format_rule_changes(rule)
-            text = f"{status} | {changes}"  # 우선순위 표시 제거
+            rows.append((f"{status} | {changes}", status.upper()))  # 우선순위 표시 제거
+        self.rule_model.set_rows(rows)
+
+    # ================= 내부 로직 =================
+    def _set_original_remark(self, remark: str):
+        """변경 여부 비교 기준 설정"""
+        self.original_remark = remark
+        self._original_remark_len = len(remark.encode("utf-16-le")) // 2
+        self._checked_revision = -1  # 비교 기준이 바뀌었으므로 다시 비교
 
-            lbl = QLabel(text)
-            lbl.setWordWrap(True)
-            lbl.setStyleSheet("font-size: 10pt;")
+    def _on_remark_changed(self):
+        self._remark_dirty_timer.start()
 
-            if status.upper() == "ACTIVE":
-                lbl.setStyleSheet("font-size: 10pt; color: #2E7D32;")
-            elif status.upper() == "INACTIVE":
-                lbl.setStyleSheet("font-size: 10pt; color: #888;")
+    def _is_saving_remark(self) -> bool:
+        return self._save_worker is not None and self._save_worker.isRunning()
 
-            self.rule_list_layout.addWidget(lbl)
+    def _release_save_worker(self):
+        """저장 워커 참조 정리 (run()이 시그널을 보낸 직후라 wait는 바로 반환)"""
+        worker = self._save_worker
+        self._save_worker = None
+        if worker is not None:
+            worker.wait()
 
-    # ================= 내부 로직 =================
-    def _on_remark_changed(self):
-        if not self.current_sap_code:
+    def _recompute_remark_dirty(self):
+        if not self.current_sap_code or self._is_saving_remark():
             self.btn_save_remark.setEnabled(False)
             return
+        document = self.remark_text.document()
+        revision = document.revision()
+        if revision == self._checked_revision:
+            return
+        self._checked_revision = revision
+        # 길이가 다르면 변경된 것 (characterCount는 마지막 문단 구분자 1개 포함, 텍스트 복사 없음)
+        if document.characterCount() - 1 != self._original_remark_len:
+            self.btn_save_remark.setEnabled(True)
+            return
         current = self.remark_text.toPlainText()
         self.btn_save_remark.setEnabled(current != self.original_remark)
 
     def _on_save_remark(self):
-        if not self.current_sap_code:
+        if not self.current_sap_code or self._is_saving_remark():
             return
+        sap_code = self.current_sap_code
         new_remark = self.remark_text.toPlainText()
-        success = update_company_remark(self.current_sap_code, new_remark)
-        if success:
-            self.original_remark = new_remark
-            self.btn_save_remark.setEnabled(False)
+        # DB 저장은 백그라운드에서 (저장 중 중복 클릭 방지)
+        self.btn_save_remark.setEnabled(False)
+        self._save_worker = WorkerThread(update_company_remark, sap_code, new_remark)
+        self._save_worker.finished.connect(
+            lambda success: self._on_save_remark_finished(success, sap_code, new_remark)
+        )
+        self._save_worker.error.connect(self._on_save_remark_error)
+        self._save_worker.start()
+
+    def _on_save_remark_finished(self, success: bool, sap_code: str, new_remark: str):
+        """Remark 저장 완료 시 호출 (그 사이 다른 기업을 선택했으면 화면 상태는 그대로 둠)"""
+        self._release_save_worker()
+        if success and sap_code == self.current_sap_code:
+            self._set_original_remark(new_remark)
+        self._checked_revision = -1
+        self._recompute_remark_dirty()
+        if not success:
+            QMessageBox.warning(self, "오류", "Remark를 저장하지 못했습니다.")
 
-    def _clear_rule_list(self):
-        while self.rule_list_layout.count():
-            item = self.rule_list_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+    def _on_save_remark_error(self, message: str):
+        """Remark 저장 중 예외 발생 시 호출 (저장 버튼을 다시 활성화하고 오류 표시)"""
+        self._release_save_worker()
+        self._checked_revision = -1  # 문서 revision은 그대로이므로 강제로 다시 비교
+        self._recompute_remark_dirty()
+        QMessageBox.critical(self, "오류", f"Remark 저장 실패: {message}")
 
-    # ===== dialogs.py 의 format_rule_changes 로직 그대로 =====
     def _format_rule_changes(self, rule: dict) -> str:
-        changes = []
-
-        def valid(val, ignore=("ALL", "NONE")):
-            return val and str(val).strip().upper() not in ignore
-
-        if valid(rule.get("repair_region")):
-            changes.append(f"수리지역: {rule['repair_region']}")
-        if valid(rule.get("project_code")):
-            changes.append(f"프로젝트: {rule['project_code']}")
-        if rule.get("exclude_project_code"):
-            changes.append(f"제외: {rule['exclude_project_code']}")
-        if valid(rule.get("vehicle_classification")):
-            changes.append(f"차계: {rule['vehicle_classification']}")
-        if valid(rule.get("part_name")):
-            changes.append(f"부품: {rule['part_name']}")
-        if valid(rule.get("part_no")):
-            changes.append(f"부품번호: {rule['part_no']}")
-        if valid(rule.get("engine_form")):
-            changes.append(f"엔진: {rule['engine_form']}")
-        if rule.get("liability_ratio") is not None:
-            changes.append(f"구상율: {rule['liability_ratio']}%")
-        if rule.get("warranty_mileage_override") is not None:
-            changes.append(f"주행거리: {rule['warranty_mileage_override']}km")
-        if rule.get("warranty_period_override") is not None:
-            years = rule["warranty_period_override"] / 365.0
-            changes.append(f"보증기간: {years:.1f}년")
-        if rule.get("amount_cap_value") is not None and valid(rule.get("amount_cap_type")):
-            changes.append(f"상한: {rule['amount_cap_value']} ({rule['amount_cap_type']})")
-        if rule.get("valid_from"):
-            changes.append(f"시작일: {rule['valid_from']}")
-        if rule.get("valid_to"):
-            changes.append(f"종료일: {rule['valid_to']}")
-
-        return " | ".join(changes) if changes else "기본 규칙"
+        values = [rule.get(f) for f in _RULE_CHANGE_FIELDS]
+        try:
+            return _format_rule_changes_cached(*values)
+        except TypeError:  # 해시 불가 값이 섞인 경우 캐시 없이 계산
+            return _format_rule_changes_cached.__wrapped__(*values)
@@ -1,17 +1,63 @@
 """
 미리보기 컨테이너 - 엑셀 테이블
 """
-from PySide6.QtCore import Qt, QTimer
+import math
+
+from PySide6.QtCore import Qt, QRectF, QVariantAnimation
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout,
-    QTableView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QLabel, QApplication
+    QTableView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QLabel, QApplication,
+    QHeaderView, QAbstractItemView
 )
-from PySide6.QtGui import QPen, QPainter, QColor, QBrush
+from PySide6.QtGui import QPen, QPainter, QColor, QBrush, QPalette
+
+
+# 셀 텍스트 정렬 (paint마다 플래그 조합하지 않도록 1회 계산)
+_TEXT_ALIGN = Qt.AlignLeft | Qt.AlignVCenter
 
 
 class NoElideDelegate(QStyledItemDelegate):
     """말줄임표 없이 전체 텍스트 표시하는 Delegate - 텍스트 직접 그리기"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 글자색별 QPen 캐시 (rgba -> QPen, 보통 일반/선택 2개뿐)
+        self._pens: dict[int, QPen] = {}
+        # 폰트별 가장 좁은 글자 폭 캐시 (font.key() -> px), 긴 텍스트를 보이는 만큼만 그릴 때 사용
+        self._narrow_widths: dict[str, int] = {}
+    
+    def _pen_for(self, color: QColor) -> QPen:
+        """글자색에 해당하는 QPen 반환 (없을 때만 생성)"""
+        key = color.rgba()
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = QPen(color)
+            self._pens[key] = pen
+        return pen
+    
+    def _visible_text(self, text: str, option) -> str:
+        """
+        셀 폭에 보일 수 있는 만큼만 잘라낸 텍스트 반환 (말줄임표 없음)
+        - 가장 좁은 글자 기준 최대 글자 수 + 여유분까지만 남기므로 화면에 보이는 결과는 동일
+        - 여러 줄 텍스트는 세로 정렬이 달라질 수 있으므로 그대로 둠
+        """
+        key = option.font.key()
+        narrow = self._narrow_widths.get(key)
+        if narrow is None:
+            fm = option.fontMetrics
+            narrow = max(1, min(fm.horizontalAdvance(ch) for ch in " .,'|il"))
+            self._narrow_widths[key] = narrow
+        max_chars = option.rect.width() // narrow + 16
+        if len(text) <= max_chars or "\n" in text:
+            return text
+        return text[:max_chars]
+    
     def paint(self, painter, option, index):
+        # 텍스트 가져오기 (빈 셀은 기본 그리기로 배경만 그리고 종료)
+        text = index.data(Qt.DisplayRole)
+        if not text:
+            super().paint(painter, option, index)
+            return
+        
         # 스타일 옵션 초기화
         self.initStyleOption(option, index)
         
@@ -19,88 +65,87 @@ class NoElideDelegate(QStyledItemDelegate):
         option.text = ""  # 텍스트를 비워서 배경만 그림
         
         # 배경과 테두리 그리기 (선택 상태, hover 등)
-        style = option.widget.style() if option.widget else QStyle()
-        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, widget)
         
-        # 텍스트 가져오기
-        text = index.data(Qt.DisplayRole)
-        if text:
-            painter.save()
-            
-            # 텍스트 색상 설정 (선택된 경우와 일반 경우 구분)
-            if option.state & QStyle.State_Selected:
-                painter.setPen(QPen(option.palette.highlightedText().color()))
-            else:
-                painter.setPen(QPen(option.palette.text().color()))
-            
-            # 텍스트를 말줄임 없이 직접 그리기
-            text_rect = option.rect.adjusted(4, 0, -4, 0)  # 좌우 패딩
-            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, str(text))
-            
-            painter.restore()
+        painter.save()
+        
+        # 텍스트 색상 설정 (선택된 경우와 일반 경우 구분)
+        if option.state & QStyle.State_Selected:
+            painter.setPen(self._pen_for(option.palette.highlightedText().color()))
+        else:
+            painter.setPen(self._pen_for(option.palette.text().color()))
+        
+        # 텍스트를 말줄임 없이 직접 그리기
+        text_rect = option.rect.adjusted(4, 0, -4, 0)  # 좌우 패딩
+        painter.drawText(text_rect, _TEXT_ALIGN, self._visible_text(str(text), option))
+        
+        painter.restore()
 
 
 class SpinnerWidget(QWidget):
     """회전 스피너 위젯"""
+    _DOT_COUNT = 8
+    _DOT_SIZE = 5
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(50, 50)
-        self._angle = 0
         
-        # QTimer를 사용한 회전 애니메이션
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._rotate)
-        self.timer.setInterval(50)  # 50ms마다 업데이트
+        # 프레임마다 만들지 않도록 점 색상(투명도)과 위치(0도 기준)를 미리 계산
+        # - 투명도: 첫 번째 점이 가장 진하고, 마지막이 가장 투명 (255, 225, ..., 최소 50)
+        # - 위치: 중심 기준 45도 간격, 회전은 paintEvent에서 painter.rotate로 처리
+        self._dot_brushes = []
+        for i in range(self._DOT_COUNT):
+            color = QColor("#2196F3")
+            color.setAlpha(max(255 - i * 30, 50))
+            self._dot_brushes.append(QBrush(color))
+        radius = min(self.width(), self.height()) / 2 - 8
+        step = 360 / self._DOT_COUNT
+        self._dot_rects = [
+            QRectF(
+                radius * math.cos(math.radians(i * step)) - self._DOT_SIZE / 2,
+                radius * math.sin(math.radians(i * step)) - self._DOT_SIZE / 2,
+                self._DOT_SIZE, self._DOT_SIZE,
+            )
+            for i in range(self._DOT_COUNT)
+        ]
+        
+        # 회전 애니메이션 (각도 진행은 Qt 애니메이션이 담당, 값이 바뀔 때 다시 그리기만 함)
+        # - 1.8초에 1바퀴 (기존 50ms마다 10도와 같은 속도)
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(360.0)
+        self.animation.setDuration(1800)
+        self.animation.setLoopCount(-1)  # 무한 반복
+        self.animation.valueChanged.connect(self._on_angle_changed)
     
-    def _rotate(self):
-        """회전 업데이트"""
-        self._angle = (self._angle + 10) % 360  # 10도씩 회전
-        self.update()  # 화면 갱신
+    def _on_angle_changed(self, _angle):
+        """회전 각도 변경 시 화면 갱신"""
+        self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
         
-        # 중앙 좌표
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        radius = min(self.width(), self.height()) / 2 - 8
-        
-        # 원형 스피너 그리기 (8개의 점)
-        import math
-        for i in range(8):
-            # 각 점의 각도 (현재 회전 각도 + 점의 기본 각도)
-            angle_deg = self._angle + (i * 45)  # 45도씩 떨어진 8개의 점
-            angle_rad = math.radians(angle_deg)
-            
-            # 점의 위치 계산
-            x = center_x + radius * math.cos(angle_rad)
-            y = center_y + radius * math.sin(angle_rad)
-            
-            # 투명도 계산 (첫 번째 점이 가장 진하고, 마지막이 가장 투명)
-            alpha = int(255 - (i * 30))  # 255, 225, 195, ... , 45
-            if alpha < 50:
-                alpha = 50  # 최소 투명도 보장
-            
-            color = QColor("#2196F3")
-            color.setAlpha(alpha)
-            
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            
-            # 작은 원 그리기
-            dot_size = 5
-            painter.drawEllipse(int(x - dot_size/2), int(y - dot_size/2), dot_size, dot_size)
+        # 중앙으로 이동 후 현재 각도만큼 회전 (점 위치는 미리 계산한 값 사용)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.rotate(self.animation.currentValue() or 0.0)
+        for brush, rect in zip(self._dot_brushes, self._dot_rects):
+            painter.setBrush(brush)
+            painter.drawEllipse(rect)
     
     def start(self):
         """애니메이션 시작"""
-        self._angle = 0
-        self.timer.start()
+        self.animation.stop()  # 0도부터 다시 시작
+        self.animation.start()
         self.show()  # 위젯 표시 확인
     
     def stop(self):
         """애니메이션 중지"""
-        self.timer.stop()
+        self.animation.stop()
 
 
 class PreviewContainer(QWidget):
@@ -115,8 +160,19 @@ class PreviewContainer(QWidget):
         # 엑셀 테이블
         self.table = QTableView()
         self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(True)
+        # 헤더 클릭 정렬은 사용하지 않음 (모델 교체 때마다 정렬 패스가 돌지 않도록 처음부터 비활성화)
+        self.table.setSortingEnabled(False)
         self.table.setWordWrap(False)
+        # 컬럼 기본 너비(엑셀에 지정된 너비가 없을 때)
+        self.table.horizontalHeader().setDefaultSectionSize(100)
+        # 헤더 경계 더블클릭 자동 맞춤 시 전체 행 대신 최대 200행만 샘플링
+        self.table.horizontalHeader().setResizeContentsPrecision(200)
+        # 행 높이는 고정(기본 22px, 엑셀에 지정된 높이만 개별 적용) - 행마다 sizeHint 계산 방지
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        # 스크롤은 픽셀 단위 (행/열 단위 스크롤 시 넓은 컬럼·병합 셀에서 점프하는 문제 방지)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         
         # 말줄임표 없이 전체 텍스트 표시
         self.table.setItemDelegate(NoElideDelegate(self.table))
@@ -125,13 +181,39 @@ class PreviewContainer(QWidget):
         
         self.setLayout(layout)
         
-        # 로딩 오버레이 위젯
+        # 로딩 오버레이 (처음 show_loading 호출 시 생성)
+        self.loading_overlay: QWidget | None = None
+        self.spinner: SpinnerWidget | None = None
+        self.loading_message: QLabel | None = None
+    
+    def get_table(self) -> QTableView:
+        """엑셀 테이블 반환"""
+        return self.table
+    
+    def load_model(self, model):
+        """
+        테이블 모델 교체 (테이블 모델은 table.setModel 대신 항상 이 함수로 교체)
+        - 교체 중에는 정렬/화면 갱신을 끄고, 끝난 뒤 한 번만 다시 그림
+        - 이전 시트의 병합(span)도 함께 제거
+        """
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setSortingEnabled(False)
+            self.table.clearSpans()
+            self.table.setModel(model)
+        finally:
+            self.table.setUpdatesEnabled(True)
+    
+    def _ensure_overlay(self):
+        """로딩 오버레이 위젯 생성 (최초 1회)"""
+        if self.loading_overlay is not None:
+            return
         self.loading_overlay = QWidget(self)
-        self.loading_overlay.setStyleSheet("""
-            QWidget {
-                background-color: rgba(255, 255, 255, 240);
-            }
-        """)
+        # 반투명 흰 배경 (스타일시트 대신 팔레트로 채움 - CSS 파싱/자식 위젯 전파 없음)
+        overlay_palette = self.loading_overlay.palette()
+        overlay_palette.setColor(QPalette.Window, QColor(255, 255, 255, 240))
+        self.loading_overlay.setPalette(overlay_palette)
+        self.loading_overlay.setAutoFillBackground(True)
         self.loading_overlay.hide()
         self.loading_overlay.setAttribute(Qt.WA_TransparentForMouseEvents, False)  # 클릭 이벤트 차단
         self.loading_overlay.setAttribute(Qt.WA_NoSystemBackground, False)
@@ -158,12 +240,9 @@ class PreviewContainer(QWidget):
         """)
         overlay_layout.addWidget(self.loading_message)
     
-    def get_table(self) -> QTableView:
-        """엑셀 테이블 반환"""
-        return self.table
-    
     def show_loading(self, message: str = "처리 중"):
         """로딩 애니메이션 표시"""
+        self._ensure_overlay()
         self.loading_message.setText(message)
         # 오버레이 크기 설정 (위젯 크기가 0이면 기본값 사용)
         width = self.width() if self.width() > 0 else 800
@@ -171,25 +250,27 @@ class PreviewContainer(QWidget):
         self.loading_overlay.setGeometry(0, 0, width, height)
         self.loading_overlay.show()
         self.loading_overlay.raise_()  # 테이블 위에 표시
-        self.loading_overlay.update()  # 즉시 업데이트
         self.spinner.start()
-        # UI 업데이트 강제
-        QApplication.processEvents()
+        # 이벤트 루프 재진입(processEvents) 없이 오버레이만 바로 그림
+        # (호출 측은 무거운 작업을 WorkerThread로 넘기므로 이후 페인트도 정상 진행)
+        self.loading_overlay.repaint()
     
     def hide_loading(self):
         """로딩 애니메이션 숨김"""
+        if self.loading_overlay is None:
+            return
         self.spinner.stop()
         self.loading_overlay.hide()
     
     def resizeEvent(self, event):
         """위젯 크기 변경 시 오버레이 크기도 조정"""
         super().resizeEvent(event)
-        if self.loading_overlay.isVisible():
+        if self.loading_overlay is not None and self.loading_overlay.isVisible():
             self.loading_overlay.setGeometry(0, 0, self.width(), self.height())
     
     def showEvent(self, event):
         """위젯이 표시될 때 오버레이 위치 업데이트"""
         super().showEvent(event)
-        if self.loading_overlay.isVisible():
+        if self.loading_overlay is not None and self.loading_overlay.isVisible():
             self.loading_overlay.setGeometry(0, 0, self.width(), self.height())
 
@@ -3,14 +3,179 @@ Rule 관련 다이얼로그
 """
 from typing import Dict, Any, List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QHBoxLayout, QVBoxLayout,
     QPushButton, QSpinBox, QDoubleSpinBox, QLineEdit,
-    QComboBox, QTableWidget, QTableWidgetItem
+    QComboBox, QTableView, QHeaderView, QAbstractItemView, QGroupBox
 )
 
 
+# 변경점 표시용 문자열 조건 필드 (키, 표시 접두어, 표시 안 하는 값) - 표시 순서대로
+# - 표시 안 하는 값이 None이면 NULL/빈 값만 제외
+# - 접두어는 미리 "표시명: "으로 만들어 두고 값만 이어 붙임 (f-string 포맷 생략)
+_RULE_TEXT_FIELDS = (
+    ("project_code", "프로젝트: ", "ALL"),
+    ("exclude_project_code", "제외: ", None),
+    ("vehicle_classification", "차계: ", "ALL"),
+    ("part_name", "부품: ", "ALL"),
+    ("part_no", "부품번호: ", "ALL"),
+    ("engine_form", "엔진: ", "ALL"),
+)
+# 적용 기간 필드 (키, 표시 접두어) - 맨 뒤에 표시
+_RULE_DATE_FIELDS = (
+    ("valid_from", "시작일: "),
+    ("valid_to", "종료일: "),
+)
+
+
+# AddRuleDialog 기본 입력 위젯 정의 (속성명, 위젯 클래스, 설정, 라벨) - 폼 표시 순서대로
+# - 설정은 _WIDGET_SETTERS의 키를 적힌 순서대로 적용
+_ADD_RULE_FIELDS = (
+    # Priority (DEFAULT -1, 트리거로 자동 채움)
+    ("priority_spin", QSpinBox,
+     {"range": (-1, 999), "value": -1, "special": "자동 (트리거)"}, "우선순위:"),
+    # Status (DEFAULT 'ACTIVE', CHECK IN ('ACTIVE','INACTIVE'))
+    ("status_combo", QComboBox,
+     {"items": ["ACTIVE", "INACTIVE"], "current": "ACTIVE"}, "상태 *:"),
+    # Repair Region (CHECK IN ('DOMESTIC','OVERSEAS','ALL'))
+    ("repair_region_combo", QComboBox,
+     {"items": ["DOMESTIC", "OVERSEAS", "ALL"], "current": "ALL"}, "수리 지역 *:"),
+    # Project Code (DEFAULT 'ALL')
+    ("project_code_edit", QLineEdit,
+     {"placeholder": "기본값: ALL", "text": "ALL"}, "프로젝트 코드 *:"),
+    # Vehicle Classification (DEFAULT 'ALL')
+    ("vehicle_class_edit", QLineEdit,
+     {"placeholder": "기본값: ALL", "text": "ALL"}, "차량 분류 *:"),
+    # Part No (NOT NULL DEFAULT 'ALL')
+    ("part_no_edit", QLineEdit,
+     {"placeholder": "기본값: ALL", "text": "ALL"}, "부품 번호 *:"),
+    # Part Name (NOT NULL DEFAULT 'ALL')
+    ("part_name_edit", QLineEdit,
+     {"placeholder": "기본값: ALL", "text": "ALL"}, "부품명 *:"),
+    # Engine Form (NOT NULL DEFAULT 'ALL')
+    ("engine_form_edit", QLineEdit,
+     {"placeholder": "기본값: ALL", "text": "ALL"}, "엔진 형태 *:"),
+    # Amount Cap Type (DEFAULT 'NONE', CHECK IN ('LABOR','OUTSOURCE_LABOR','BOTH_LABOR','NONE'))
+    ("amount_cap_combo", QComboBox,
+     {"items": ["NONE", "LABOR", "OUTSOURCE_LABOR", "BOTH_LABOR"], "current": "NONE"}, "금액 상한 타입 *:"),
+    # Amount Cap Value (NULL 허용)
+    ("amount_cap_spin", QSpinBox,
+     {"range": (0, 999999999), "value": 0, "special": "없음"}, "금액 상한 값:"),
+    # Liability Ratio (선택사항 - LABOR 최댓값 규칙의 경우 NULL 가능)
+    ("liability_ratio_spin", QDoubleSpinBox,
+     {"range": (0.0, 100.0), "decimals": 2, "suffix": " %", "value": 0.0,
+      "special": "없음 (LABOR 최댓값 규칙용)"}, "구상율:"),
+)
+
+# 고급 옵션 입력 위젯 (NULL 허용 조건) - "고급 옵션"을 처음 펼칠 때 생성
+_ADD_RULE_OPTIONAL_FIELDS = (
+    # Exclude Project Code (NULL 허용)
+    ("exclude_project_code_edit", QLineEdit,
+     {"placeholder": "제외할 프로젝트 코드 (선택사항)"}, "제외 프로젝트 코드:"),
+    # Warranty Mileage Override (NULL 허용)
+    ("warranty_mileage_spin", QSpinBox,
+     {"range": (0, 1000000), "value": 0, "special": "없음"}, "보증 주행거리 오버라이드 (km):"),
+    # Warranty Period Override (NULL 허용, 일 단위)
+    ("warranty_period_spin", QSpinBox,
+     {"range": (0, 3650), "value": 0, "special": "없음"}, "보증 기간 오버라이드 (일):"),
+    # Valid From (날짜 형식)
+    ("valid_from_edit", QLineEdit,
+     {"placeholder": "YYYY-MM-DD (선택사항)"}, "유효 시작일:"),
+    # Valid To (날짜 형식)
+    ("valid_to_edit", QLineEdit,
+     {"placeholder": "YYYY-MM-DD (선택사항)"}, "유효 종료일:"),
+)
+
+# 수정 모드에서 rule 값을 채울 위젯 (rule 키, 위젯 속성명, 채우는 방식) - _LOADER_SETTERS 참고
+_RULE_LOADERS = (
+    ("priority", "priority_spin", "int"),
+    ("status", "status_combo", "combo"),
+    ("repair_region", "repair_region_combo", "combo"),
+    ("project_code", "project_code_edit", "text"),
+    ("vehicle_classification", "vehicle_class_edit", "text"),
+    ("part_no", "part_no_edit", "text"),
+    ("part_name", "part_name_edit", "text"),
+    ("engine_form", "engine_form_edit", "text"),
+    ("liability_ratio", "liability_ratio_spin", "float"),
+    ("amount_cap_type", "amount_cap_combo", "combo"),
+    ("amount_cap_value", "amount_cap_spin", "int_or_skip"),
+)
+# 고급 옵션 위젯 (값이 하나라도 있으면 고급 옵션을 펼친 뒤 채움)
+_OPTIONAL_RULE_LOADERS = (
+    ("exclude_project_code", "exclude_project_code_edit", "text"),
+    ("warranty_mileage_override", "warranty_mileage_spin", "int_or_skip"),
+    ("warranty_period_override", "warranty_period_spin", "int_or_skip"),
+    ("valid_from", "valid_from_edit", "text"),
+    ("valid_to", "valid_to_edit", "text"),
+)
+_OPTIONAL_RULE_KEYS = tuple(key for key, _, _ in _OPTIONAL_RULE_LOADERS)
+
+# 위젯 설정 키 -> 호출할 메서드 (범위는 인자 2개로 펼쳐서 호출)
+_WIDGET_SETTERS = {
+    "range": "setRange",
+    "decimals": "setDecimals",
+    "suffix": "setSuffix",
+    "value": "setValue",
+    "special": "setSpecialValueText",
+    "items": "addItems",
+    "current": "setCurrentText",
+    "placeholder": "setPlaceholderText",
+    "text": "setText",
+}
+
+
+def _apply_widget_config(widget, config: Dict[str, Any]) -> None:
+    """_ADD_RULE_FIELDS의 설정을 위젯에 적용"""
+    for key, value in config.items():
+        setter = getattr(widget, _WIDGET_SETTERS[key])
+        if key == "range":
+            setter(*value)
+        else:
+            setter(value)
+        if key == "items":
+            # 콤보박스 항목 -> 인덱스 (수정 모드에서 값으로 항목 선택 시 사용)
+            widget._index_of = {text: i for i, text in enumerate(value)}
+
+
+def _load_int(widget, value) -> None:
+    if value is not None:
+        widget.setValue(int(value))
+
+
+def _load_int_or_skip(widget, value) -> None:
+    # 0/NULL이면 기본값("없음") 유지
+    if value:
+        widget.setValue(int(value))
+
+
+def _load_float(widget, value) -> None:
+    # None이면 0으로 표시 (SpecialValueText)
+    widget.setValue(float(value) if value is not None else 0.0)
+
+
+def _load_combo(widget, value) -> None:
+    # findText 선형 탐색 대신 항목 추가 시 만들어 둔 {텍스트: 인덱스} 사용
+    idx = widget._index_of.get(str(value), -1) if value is not None else -1
+    if idx >= 0:
+        widget.setCurrentIndex(idx)
+
+
+def _load_text(widget, value) -> None:
+    widget.setText(str(value) if value is not None else "")
+
+
+# _RULE_LOADERS의 채우는 방식 -> 함수
+_LOADER_SETTERS = {
+    "int": _load_int,
+    "int_or_skip": _load_int_or_skip,
+    "float": _load_float,
+    "combo": _load_combo,
+    "text": _load_text,
+}
+
+
 class AddRuleDialog(QDialog):
     """Rule 추가/수정 다이얼로그"""
     def __init__(self, rule_table_name: str, parent=None, rule_data: Dict[str, Any] = None):
@@ -25,109 +190,26 @@ class AddRuleDialog(QDialog):
         
         layout = QFormLayout()
         
-        # Priority (DEFAULT -1, 트리거로 자동 채움)
-        self.priority_spin = QSpinBox()
-        self.priority_spin.setRange(-1, 999)
-        self.priority_spin.setValue(-1)
-        self.priority_spin.setSpecialValueText("자동 (트리거)")
-        layout.addRow("우선순위:", self.priority_spin)
-        
-        # Status (DEFAULT 'ACTIVE', CHECK IN ('ACTIVE','INACTIVE'))
-        self.status_combo = QComboBox()
-        self.status_combo.addItems(["ACTIVE", "INACTIVE"])
-        self.status_combo.setCurrentText("ACTIVE")  # 기본값
-        layout.addRow("상태 *:", self.status_combo)
-        
-        # Repair Region (CHECK IN ('DOMESTIC','OVERSEAS','ALL'))
-        self.repair_region_combo = QComboBox()
-        self.repair_region_combo.addItems(["DOMESTIC", "OVERSEAS", "ALL"])
-        self.repair_region_combo.setCurrentText("ALL")  # 기본값
-        layout.addRow("수리 지역 *:", self.repair_region_combo)
-        
-        # Project Code (DEFAULT 'ALL')
-        self.project_code_edit = QLineEdit()
-        self.project_code_edit.setPlaceholderText("기본값: ALL")
-        self.project_code_edit.setText("ALL")  # 기본값
-        layout.addRow("프로젝트 코드 *:", self.project_code_edit)
-        
-        # Exclude Project Code (NULL 허용)
-        self.exclude_project_code_edit = QLineEdit()
-        self.exclude_project_code_edit.setPlaceholderText("제외할 프로젝트 코드 (선택사항)")
-        layout.addRow("제외 프로젝트 코드:", self.exclude_project_code_edit)
-        
-        # Vehicle Classification (DEFAULT 'ALL')
-        self.vehicle_class_edit = QLineEdit()
-        self.vehicle_class_edit.setPlaceholderText("기본값: ALL")
-        self.vehicle_class_edit.setText("ALL")  # 기본값
-        layout.addRow("차량 분류 *:", self.vehicle_class_edit)
-        
-        # Part No (NOT NULL DEFAULT 'ALL')
-        self.part_no_edit = QLineEdit()
-        self.part_no_edit.setPlaceholderText("기본값: ALL")
-        self.part_no_edit.setText("ALL")  # 기본값
-        layout.addRow("부품 번호 *:", self.part_no_edit)
-        
-        # Part Name (NOT NULL DEFAULT 'ALL')
-        self.part_name_edit = QLineEdit()
-        self.part_name_edit.setPlaceholderText("기본값: ALL")
-        self.part_name_edit.setText("ALL")  # 기본값
-        layout.addRow("부품명 *:", self.part_name_edit)
-        
-        # Engine Form (NOT NULL DEFAULT 'ALL')
-        self.engine_form_edit = QLineEdit()
-        self.engine_form_edit.setPlaceholderText("기본값: ALL")
-        self.engine_form_edit.setText("ALL")  # 기본값
-        layout.addRow("엔진 형태 *:", self.engine_form_edit)
-        
-        # Warranty Mileage Override (NULL 허용)
-        self.warranty_mileage_spin = QSpinBox()
-        self.warranty_mileage_spin.setRange(0, 1000000)
-        self.warranty_mileage_spin.setValue(0)
-        self.warranty_mileage_spin.setSpecialValueText("없음")
-        layout.addRow("보증 주행거리 오버라이드 (km):", self.warranty_mileage_spin)
-        
-        # Warranty Period Override (NULL 허용, 일 단위)
-        self.warranty_period_spin = QSpinBox()
-        self.warranty_period_spin.setRange(0, 3650)
-        self.warranty_period_spin.setValue(0)
-        self.warranty_period_spin.setSpecialValueText("없음")
-        layout.addRow("보증 기간 오버라이드 (일):", self.warranty_period_spin)
-        
-        # Amount Cap Type (DEFAULT 'NONE', CHECK IN ('LABOR','OUTSOURCE_LABOR','BOTH_LABOR','NONE'))
-        self.amount_cap_combo = QComboBox()
-        self.amount_cap_combo.addItems(["NONE", "LABOR", "OUTSOURCE_LABOR", "BOTH_LABOR"])
-        self.amount_cap_combo.setCurrentText("NONE")  # 기본값
-        layout.addRow("금액 상한 타입 *:", self.amount_cap_combo)
-        
-        # Amount Cap Value (NULL 허용)
-        self.amount_cap_spin = QSpinBox()
-        self.amount_cap_spin.setRange(0, 999999999)
-        self.amount_cap_spin.setValue(0)
-        self.amount_cap_spin.setSpecialValueText("없음")
-        layout.addRow("금액 상한 값:", self.amount_cap_spin)
-        
-        # Liability Ratio (선택사항 - LABOR 최댓값 규칙의 경우 NULL 가능)
-        self.liability_ratio_spin = QDoubleSpinBox()
-        self.liability_ratio_spin.setRange(0.0, 100.0)
-        self.liability_ratio_spin.setDecimals(2)
-        self.liability_ratio_spin.setSuffix(" %")
-        self.liability_ratio_spin.setValue(0.0)
-        self.liability_ratio_spin.setSpecialValueText("없음 (LABOR 최댓값 규칙용)")
-        layout.addRow("구상율:", self.liability_ratio_spin)
+        # 입력 위젯 생성 (_ADD_RULE_FIELDS 순서대로)
+        add_row = layout.addRow
+        for attr, widget_cls, config, label in _ADD_RULE_FIELDS:
+            widget = widget_cls()
+            _apply_widget_config(widget, config)
+            setattr(self, attr, widget)
+            add_row(label, widget)
         
         # amount_cap_type과 amount_cap_value 변경 시 구상율 필수 여부 업데이트
         self.amount_cap_combo.currentTextChanged.connect(self._update_liability_ratio_required)
         self.amount_cap_spin.valueChanged.connect(self._update_liability_ratio_required)
         
-        # Valid From (날짜 형식)
-        self.valid_from_edit = QLineEdit()
-        self.valid_from_edit.setPlaceholderText("YYYY-MM-DD (선택사항)")
-        layout.addRow("유효 시작일:", self.valid_from_edit)
-        
-        # Valid To (날짜 형식)
-        self.valid_to_edit = QLineEdit()
-        self.valid_to_edit.setPlaceholderText("YYYY-MM-DD (선택사항)")
-        layout.addRow("유효 종료일:", self.valid_to_edit)
+        # 고급 옵션 (처음 체크할 때 입력 위젯 생성, 이후 체크 해제해도 입력값은 그대로 사용)
+        self.optional_group = QGroupBox("고급 옵션")
+        self.optional_group.setCheckable(True)
+        self.optional_group.setChecked(False)
+        self._optional_layout = QFormLayout(self.optional_group)
+        self._optional_built = False
+        self.optional_group.toggled.connect(self._on_optional_toggled)
+        layout.addRow(self.optional_group)
         
         # 버튼
         button_layout = QHBoxLayout()
@@ -145,67 +227,32 @@ class AddRuleDialog(QDialog):
         if self.is_edit_mode and rule_data:
             self._load_rule_data(rule_data)
     
+    def _on_optional_toggled(self, checked: bool):
+        """고급 옵션 체크 시 입력 위젯 생성 (최초 1회)"""
+        if checked and not self._optional_built:
+            add_row = self._optional_layout.addRow
+            for attr, widget_cls, config, label in _ADD_RULE_OPTIONAL_FIELDS:
+                widget = widget_cls()
+                _apply_widget_config(widget, config)
+                setattr(self, attr, widget)
+                add_row(label, widget)
+            self._optional_built = True
+    
     def _load_rule_data(self, rule_data: Dict[str, Any]):
         """기존 규칙 데이터로 폼 채우기"""
-        if "priority" in rule_data:
-            self.priority_spin.setValue(rule_data["priority"])
-        
-        if "status" in rule_data:
-            idx = self.status_combo.findText(rule_data["status"])
-            if idx >= 0:
-                self.status_combo.setCurrentIndex(idx)
-        
-        if "repair_region" in rule_data:
-            idx = self.repair_region_combo.findText(rule_data["repair_region"])
-            if idx >= 0:
-                self.repair_region_combo.setCurrentIndex(idx)
+        self._apply_rule_loaders(_RULE_LOADERS, rule_data)
         
-        if "project_code" in rule_data:
-            self.project_code_edit.setText(str(rule_data["project_code"]))
-        
-        if "exclude_project_code" in rule_data:
-            exclude_code = rule_data["exclude_project_code"]
-            self.exclude_project_code_edit.setText(exclude_code if exclude_code is not None else "")
-        
-        if "vehicle_classification" in rule_data:
-            self.vehicle_class_edit.setText(str(rule_data["vehicle_classification"]))
-        
-        if "part_no" in rule_data:
-            self.part_no_edit.setText(str(rule_data["part_no"]))
-        
-        if "part_name" in rule_data:
-            self.part_name_edit.setText(str(rule_data["part_name"]))
-        
-        if "engine_form" in rule_data:
-            self.engine_form_edit.setText(str(rule_data["engine_form"]))
-        
-        if "warranty_mileage_override" in rule_data and rule_data["warranty_mileage_override"]:
-            self.warranty_mileage_spin.setValue(int(rule_data["warranty_mileage_override"]))
-        
-        if "warranty_period_override" in rule_data and rule_data["warranty_period_override"]:
-            self.warranty_period_spin.setValue(int(rule_data["warranty_period_override"]))
-        
-        if "liability_ratio" in rule_data:
-            # liability_ratio가 None일 수 있음
-            liability_ratio = rule_data.get("liability_ratio")
-            if liability_ratio is not None:
-                self.liability_ratio_spin.setValue(float(liability_ratio))
-            else:
-                self.liability_ratio_spin.setValue(0.0)  # None이면 0으로 표시 (SpecialValueText)
-        
-        if "amount_cap_type" in rule_data:
-            idx = self.amount_cap_combo.findText(rule_data["amount_cap_type"])
-            if idx >= 0:
-                self.amount_cap_combo.setCurrentIndex(idx)
-        
-        if "amount_cap_value" in rule_data and rule_data["amount_cap_value"]:
-            self.amount_cap_spin.setValue(int(rule_data["amount_cap_value"]))
-        
-        if "valid_from" in rule_data:
-            self.valid_from_edit.setText(str(rule_data["valid_from"]) if rule_data["valid_from"] else "")
-        
-        if "valid_to" in rule_data:
-            self.valid_to_edit.setText(str(rule_data["valid_to"]) if rule_data["valid_to"] else "")
+        # 고급 옵션 값이 있는 규칙만 고급 옵션을 펼쳐서 채움
+        if not any(rule_data.get(key) for key in _OPTIONAL_RULE_KEYS):
+            return
+        self.optional_group.setChecked(True)
+        self._apply_rule_loaders(_OPTIONAL_RULE_LOADERS, rule_data)
+    
+    def _apply_rule_loaders(self, loaders, rule_data: Dict[str, Any]):
+        """(rule 키, 위젯 속성명, 채우는 방식) 목록대로 rule 값을 위젯에 채움 (rule에 없는 키는 건너뜀)"""
+        for key, attr, kind in loaders:
+            if key in rule_data:
+                _LOADER_SETTERS[kind](getattr(self, attr), rule_data[key])
     
     def _update_liability_ratio_required(self):
         """amount_cap_type과 amount_cap_value에 따라 구상율 필수 여부 업데이트"""
@@ -220,40 +267,119 @@ class AddRuleDialog(QDialog):
         if priority == -1:
             priority = None
         
-        # Warranty overrides: 0이면 None
-        warranty_mileage = self.warranty_mileage_spin.value()
-        if warranty_mileage == 0:
-            warranty_mileage = None
-        
-        warranty_period = self.warranty_period_spin.value()
-        if warranty_period == 0:
-            warranty_period = None
+        # 고급 옵션: 위젯이 만들어졌으면 체크 여부와 관계없이 입력값 사용
+        if self._optional_built:
+            exclude_project_code = self.exclude_project_code_edit.text().strip() or None
+            # Warranty overrides: 0이면 None
+            warranty_mileage = self.warranty_mileage_spin.value() or None
+            warranty_period = self.warranty_period_spin.value() or None
+            valid_from = self.valid_from_edit.text().strip() or None
+            valid_to = self.valid_to_edit.text().strip() or None
+        else:
+            # 고급 옵션 위젯을 만든 적이 없으면 기존 규칙 값 유지 (추가 모드는 모두 None)
+            loaded = self.rule_data or {}
+            exclude_project_code, warranty_mileage, warranty_period, valid_from, valid_to = (
+                loaded.get(key) or None for key in _OPTIONAL_RULE_KEYS
+            )
         
         # Amount cap value: 0이면 None
         amount_cap_value = self.amount_cap_spin.value()
         if amount_cap_value == 0:
             amount_cap_value = None
         
+        # 구상율: 0이면 None (값은 1번만 읽음)
+        liability_ratio = self.liability_ratio_spin.value()
+        if liability_ratio <= 0.0:
+            liability_ratio = None
+        
         return {
             "priority": priority,
             "status": self.status_combo.currentText(),
             "repair_region": self.repair_region_combo.currentText(),
             "project_code": self.project_code_edit.text().strip() or "ALL",
-            "exclude_project_code": self.exclude_project_code_edit.text().strip() or None,
+            "exclude_project_code": exclude_project_code,
             "vehicle_classification": self.vehicle_class_edit.text().strip() or "ALL",
             "part_no": self.part_no_edit.text().strip() or "ALL",
             "part_name": self.part_name_edit.text().strip() or "ALL",
             "engine_form": self.engine_form_edit.text().strip() or "ALL",
             "warranty_mileage_override": warranty_mileage,
             "warranty_period_override": warranty_period,
-            "liability_ratio": self.liability_ratio_spin.value() if self.liability_ratio_spin.value() > 0.0 else None,
+            "liability_ratio": liability_ratio,
             "amount_cap_type": self.amount_cap_combo.currentText(),
             "amount_cap_value": amount_cap_value,
-            "valid_from": self.valid_from_edit.text().strip() or None,
-            "valid_to": self.valid_to_edit.text().strip() or None,
+            "valid_from": valid_from,
+            "valid_to": valid_to,
         }
 
 
+class RulesTableModel(QAbstractTableModel):
+    """
+    Rule 목록 테이블 모델 (우선순위 / 상태 / 변경점)
+    - rule dict 리스트를 그대로 들고 있고, 셀 아이템 객체를 만들지 않음
+    """
+    HEADERS = ["우선순위", "상태", "변경점"]
+    # data()마다 만들지 않도록 1회 계산
+    _ALIGN_CENTER = int(Qt.AlignCenter)
+
+    def __init__(self, rules: List[Dict[str, Any]], formatter, parent=None):
+        super().__init__(parent)
+        self._rules: List[Dict[str, Any]] = list(rules)
+        self._formatter = formatter  # rule -> 변경점 문자열
+        # 행별 변경점 문자열 캐시 (처음 그릴 때 1회 계산, None이면 미계산)
+        self._formatted: List[Any] = [None] * len(self._rules)
+        self._status_brushes = {
+            "ACTIVE": QBrush(Qt.GlobalColor.green),
+            "INACTIVE": QBrush(Qt.GlobalColor.gray),
+        }
+
+    def set_rules(self, rules: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rules = list(rules)
+        self._formatted = [None] * len(self._rules)
+        self.endResetModel()
+
+    def _changes_text(self, row: int) -> str:
+        text = self._formatted[row]
+        if text is None:
+            text = self._formatter(self._rules[row])
+            self._formatted[row] = text
+        return text
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rules)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        rule = self._rules[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(rule.get("priority", ""))
+            if col == 1:
+                return rule.get("status", "")
+            return self._changes_text(index.row())
+
+        if role == Qt.TextAlignmentRole and col < 2:
+            return self._ALIGN_CENTER
+
+        if role == Qt.ForegroundRole and col == 1:
+            # ACTIVE는 초록색, INACTIVE는 회색으로 표시
+            return self._status_brushes.get((rule.get("status") or "").upper())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+
 class ViewRulesDialog(QDialog):
     """Rule 목록 보기 다이얼로그 (변경점만 표시)"""
     def __init__(self, rules: List[Dict[str, Any]], parent=None):
@@ -264,14 +390,23 @@ class ViewRulesDialog(QDialog):
         layout = QVBoxLayout()
         
         # Rule 목록 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["우선순위", "상태", "변경점"])
-        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table = QTableView()
+        self.model = RulesTableModel(rules, self.format_rule_changes, self)
+        self.table.setModel(self.model)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # 행 높이 고정 (행마다 sizeHint 계산 방지)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        # 내용 기반 너비 계산 대신 고정 너비 + 변경점 컬럼만 늘림
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.setColumnWidth(0, 70)
+        self.table.setColumnWidth(1, 90)
         self.table.setAlternatingRowColors(True)
-        
-        # Rule 데이터 채우기
-        self.populate_rules(rules)
+        self.table.setWordWrap(False)
         
         layout.addWidget(self.table)
         
@@ -287,118 +422,58 @@ class ViewRulesDialog(QDialog):
     
     def format_rule_changes(self, rule: Dict[str, Any]) -> str:
         """Rule의 변경점만 포맷팅하여 반환 (NULL, "ALL", "NONE" 제외)"""
-        changes = []
-        
-        # 수리 지역 (ALL이 아닐 때만)
-        repair_region = rule.get("repair_region")
-        if repair_region and str(repair_region).strip().upper() != "ALL":
-            changes.append(f"수리지역: {repair_region}")
-        
-        # 프로젝트 코드 (ALL이 아닐 때만)
-        project_code = rule.get("project_code")
-        if project_code:
-            project_code = str(project_code).strip()
-            if project_code and project_code.upper() != "ALL":
-                changes.append(f"프로젝트: {project_code}")
-        
-        # 제외 프로젝트 (NULL이 아닐 때만)
-        exclude_project = rule.get("exclude_project_code")
-        if exclude_project:
-            exclude_project = str(exclude_project).strip()
-            if exclude_project:
-                changes.append(f"제외: {exclude_project}")
-        
-        # 차계 (ALL이 아닐 때만)
-        vehicle_classification = rule.get("vehicle_classification")
-        if vehicle_classification:
-            vehicle_classification = str(vehicle_classification).strip()
-            if vehicle_classification and vehicle_classification.upper() != "ALL":
-                changes.append(f"차계: {vehicle_classification}")
-        
-        # 부품명 (ALL이 아닐 때만)
-        part_name = rule.get("part_name")
-        if part_name:
-            part_name = str(part_name).strip()
-            if part_name and part_name.upper() != "ALL":
-                changes.append(f"부품: {part_name}")
-        
-        # 부품 번호 (ALL이 아닐 때만)
-        part_no = rule.get("part_no")
-        if part_no:
-            part_no = str(part_no).strip()
-            if part_no and part_no.upper() != "ALL":
-                changes.append(f"부품번호: {part_no}")
-        
-        # 엔진 형식 (ALL이 아닐 때만)
-        engine_form = rule.get("engine_form")
-        if engine_form:
-            engine_form = str(engine_form).strip()
-            if engine_form and engine_form.upper() != "ALL":
-                changes.append(f"엔진: {engine_form}")
+        changes: List[str] = []
+        append = changes.append
+        get = rule.get
+        
+        # 수리 지역 (ALL이 아닐 때만, 원래 값 그대로 표시)
+        # - 대부분 정확히 "ALL"이므로 문자열 변환(strip/upper) 전에 먼저 비교
+        v = get("repair_region")
+        if v and v != "ALL" and str(v).strip().upper() != "ALL":
+            append(f"수리지역: {v}")
+        
+        # 문자열 조건 (ALL 또는 NULL이 아닐 때만)
+        for key, prefix, sentinel in _RULE_TEXT_FIELDS:
+            v = get(key)
+            if not v or v == sentinel:
+                continue
+            v = v.strip() if type(v) is str else str(v).strip()  # 대부분 문자열이므로 변환 생략
+            if v and v.upper() != sentinel:
+                append(prefix + v)
         
         # 구상율 (항상 표시)
-        liability_ratio = rule.get("liability_ratio")
-        if liability_ratio is not None:
-            changes.append(f"구상율: {liability_ratio}%")
+        v = get("liability_ratio")
+        if v is not None:
+            append(f"구상율: {v}%")
         
         # 보증 주행거리 오버라이드 (NULL이 아닐 때만)
-        warranty_mileage = rule.get("warranty_mileage_override")
-        if warranty_mileage is not None:
-            changes.append(f"주행거리: {warranty_mileage}km")
+        v = get("warranty_mileage_override")
+        if v is not None:
+            append(f"주행거리: {v}km")
         
-        # 보증 기간 오버라이드 (NULL이 아닐 때만)
-        warranty_period = rule.get("warranty_period_override")
-        if warranty_period is not None:
-            years = warranty_period / 365.0
-            changes.append(f"보증기간: {years:.1f}년")
+        # 보증 기간 오버라이드 (NULL이 아닐 때만, 일 -> 년)
+        v = get("warranty_period_override")
+        if v is not None:
+            append(f"보증기간: {v / 365.0:.1f}년")
         
         # 금액 상한 (NULL이 아니고 NONE이 아닐 때만)
-        amount_cap_value = rule.get("amount_cap_value")
-        if amount_cap_value is not None:
-            cap_type = rule.get("amount_cap_type", "NONE")
+        v = get("amount_cap_value")
+        if v is not None:
+            cap_type = get("amount_cap_type", "NONE")
             if cap_type and str(cap_type).strip().upper() != "NONE":
-                changes.append(f"상한: {amount_cap_value} ({cap_type})")
+                append(f"상한: {v} ({cap_type})")
         
-        # 적용 시작일 (NULL이 아닐 때만)
-        valid_from = rule.get("valid_from")
-        if valid_from:
-            valid_from = str(valid_from).strip()
-            if valid_from:
-                changes.append(f"시작일: {valid_from}")
-        
-        # 적용 종료일 (NULL이 아닐 때만)
-        valid_to = rule.get("valid_to")
-        if valid_to:
-            valid_to = str(valid_to).strip()
-            if valid_to:
-                changes.append(f"종료일: {valid_to}")
+        # 적용 시작일 / 종료일 (NULL이 아닐 때만)
+        for key, prefix in _RULE_DATE_FIELDS:
+            v = get(key)
+            if not v:
+                continue
+            v = v.strip() if type(v) is str else str(v).strip()
+            if v:
+                append(prefix + v)
         
         return " | ".join(changes) if changes else "기본 규칙"
     
     def populate_rules(self, rules: List[Dict[str, Any]]):
         """Rule 목록을 테이블에 채우기"""
-        self.table.setRowCount(len(rules))
-        
-        for row, rule in enumerate(rules):
-            # 우선순위
-            priority_item = QTableWidgetItem(str(rule.get("priority", "")))
-            priority_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, priority_item)
-            
-            # 상태
-            status = rule.get("status", "")
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignCenter)
-            # ACTIVE는 초록색, INACTIVE는 회색으로 표시
-            if status.upper() == "ACTIVE":
-                status_item.setForeground(Qt.GlobalColor.green)
-            elif status.upper() == "INACTIVE":
-                status_item.setForeground(Qt.GlobalColor.gray)
-            self.table.setItem(row, 1, status_item)
-            
-            # 변경점
-            changes_item = QTableWidgetItem(self.format_rule_changes(rule))
-            self.table.setItem(row, 2, changes_item)
-        
-        self.table.resizeColumnsToContents()
-
+        self.model.set_rules(rules)
@@ -27,6 +27,7 @@ class ExcelFilterProxyModel(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._col_allowed: Dict[int, Optional[Set[str]]] = {}  # col -> allowed set, None이면 필터 없음
+        self._search_text: str = ""  # 소문자로 정규화된 검색어, ""이면 검색 없음
 
     def clear_all_column_filters(self) -> None:
         self._col_allowed.clear()
@@ -44,6 +45,17 @@ class ExcelFilterProxyModel(QSortFilterProxyModel):
         self._col_allowed[col] = allowed_values
         self.invalidateFilter()
 
+    def set_search_text(self, text: str) -> None:
+        """
+        전체 컬럼 대상 검색어 설정 (대소문자 무시, 부분 문자열 일치)
+        - 정규식 대신 단순 문자열 포함 비교 사용
+        """
+        needle = (text or "").lower()
+        if needle == self._search_text:
+            return
+        self._search_text = needle
+        self.invalidateFilter()
+
     def get_column_filter(self, col: int) -> Optional[Set[str]]:
         return self._col_allowed.get(col)
     
@@ -62,20 +74,28 @@ class ExcelFilterProxyModel(QSortFilterProxyModel):
         s = str(v).strip()
         return s
 
+    def _row_contains(self, src, source_row: int, needle: str) -> bool:
+        for col in range(src.columnCount()):
+            v = src.data(src.index(source_row, col), Qt.DisplayRole)
+            if v is not None and needle in str(v).lower():
+                return True
+        return False
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # 1, 2, 3행은 항상 표시 (고정 행)
         if source_row < 3:  # 0, 1, 2 = 1행, 2행, 3행
             return True
         
-        # 2) 기존 검색(정규식)은 super가 처리
-        if not super().filterAcceptsRow(source_row, source_parent):
-            return False
-
-        # 3) 컬럼별 필터 AND
         src = self.sourceModel()
         if src is None:
             return True
 
+        # 2) 검색어: 어느 한 컬럼이라도 포함하면 통과
+        if self._search_text and not self._row_contains(src, source_row, self._search_text):
+            return False
+
+        # 3) 컬럼별 필터 AND
+
         col_count = src.columnCount()
         for col, allowed in self._col_allowed.items():
             if allowed is None:
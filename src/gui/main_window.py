@@ -3,11 +3,12 @@
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QStackedWidget
+    QPushButton, QStackedWidget, QMessageBox
 )
 
 from src.database import init_database
 from src.gui.pages.main_page import MainPageWidget
+from src.gui.workers import WorkerThread
 
 
 class MainWindow(QWidget):
@@ -18,9 +19,6 @@ class MainWindow(QWidget):
         super().__init__()
         self.setWindowTitle("엑셀 전처리 도구")
         
-        # 데이터베이스 초기화
-        init_database()
-        
         # 페이지네이션 (탭 스타일)
         page_nav = QHBoxLayout()
         page_nav.setContentsMargins(0, 0, 0, 0)
@@ -61,6 +59,20 @@ class MainWindow(QWidget):
         # 페이지 전환 연결
         self.btn_main_page.clicked.connect(lambda: self.switch_page(0))
         self.btn_comex_page.clicked.connect(lambda: self.switch_page(1))
+
+        # 데이터베이스 초기화는 백그라운드에서 (창을 먼저 띄우고, 완료되면 협력사 목록 로드)
+        self.db_worker = WorkerThread(init_database)
+        self.db_worker.finished.connect(self._on_database_ready)
+        self.db_worker.error.connect(self._on_database_error)
+        self.db_worker.start()
+
+    def _on_database_ready(self, _):
+        """DB 초기화 완료 시 각 페이지의 협력사 목록 로드"""
+        self.main_page.load_companies()
+        self.comex_page.load_companies()
+
+    def _on_database_error(self, message):
+        QMessageBox.critical(self, "오류", f"데이터베이스 초기화 실패: {message}")
     
     def _apply_tab_style(self):
         """탭 스타일 적용 (Qt Material Theme 스타일)"""
@@ -97,6 +109,9 @@ class MainWindow(QWidget):
     
     def switch_page(self, index: int):
         """페이지 전환"""
+        if index == 0 and self.stacked.currentIndex() != 0:
+            # COMEX 관리에서 Remark/규칙이 바뀌었을 수 있으므로 같은 회사도 다시 조회하게 함
+            self.main_page.invalidate_company_view()
         self.stacked.setCurrentIndex(index)
         self.btn_main_page.setChecked(index == 0)
         self.btn_comex_page.setChecked(index == 1)
@@ -9,11 +9,100 @@ Excel 데이터 모델
 """
 from __future__ import annotations
 
+import re
 from datetime import datetime, date
 from typing import Dict, Tuple, Any, List, Optional
 from collections import deque
+from functools import lru_cache
 
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor
+
+
+# dirty 조회 시 "값이 None으로 수정됨"과 "수정 안 됨"을 구분하기 위한 표식
+_MISSING = object()
+
+# 사용자 입력 숫자 판별 (쉼표 제거 후): "."이 있으면 float(), 없으면 int()가 받는 형태와 동일
+# - int: 123, -1_000 / float: -1.5, .5, 5., 1.5e3 (지수 표기는 소수점이 있을 때만)
+# - 소수점 부분이 그룹으로 잡히면(lastindex) float, 아니면 int
+# - 앞뒤 공백 허용 (int()/float()도 허용)
+_DIGITS = r"\d(?:_?\d)*"
+_NUMBER_RE = re.compile(
+    rf"\s*[+-]?(?:{_DIGITS}|({_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?)\s*"
+)
+
+# 컬럼 타입 판별 시 샘플링할 상단 행 수
+_FORMAT_SAMPLE_ROWS = 60
+
+# 원본 값 스냅샷을 한 번에 읽어 오는 행 수
+_ROW_CHUNK = 200
+
+
+# ---------- 셀 표시 포맷 ----------
+# typed=True: True/1/1.0은 해시·비교가 같으므로 타입별로 따로 캐시해야 함
+@lru_cache(maxsize=8192, typed=True)
+def _format_cached(v) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "TRUE" if v else "FALSE"
+    if isinstance(v, int):
+        return f"{v:,}"
+    if isinstance(v, float):
+        # 모든 float는 정수로 반올림하여 표시 (엑셀 스타일)
+        return f"{int(round(v)):,}"
+    if isinstance(v, (datetime, date)):
+        return v.strftime("%Y-%m-%d")
+    return str(v)
+
+
+def _format_cell_text(v) -> str:
+    """
+    셀 값 -> 표시 문자열
+    - 반복되는 숫자/날짜 값은 캐시 조회로 끝남
+    - 문자열은 그대로 반환(캐시를 문자열로 채우지 않도록)
+    """
+    if type(v) is str:
+        return v
+    try:
+        return _format_cached(v)
+    except TypeError:  # 해시 불가 값
+        return str(v)
+
+
+# ---------- 컬럼 타입별 표시 포맷터 ----------
+# 샘플로 정한 타입과 다른 값이 오면 _format_cell_text로 위임 (결과는 동일)
+def _format_int(v) -> str:
+    if type(v) is int:
+        return f"{v:,}"
+    return _format_cell_text(v)
+
+
+def _format_float(v) -> str:
+    if type(v) is float:
+        return _format_cached(v)
+    return _format_cell_text(v)
+
+
+def _format_str(v) -> str:
+    if type(v) is str:
+        return v
+    return _format_cell_text(v)
+
+
+def _format_datetime(v) -> str:
+    if type(v) is datetime or type(v) is date:
+        return _format_cached(v)
+    return _format_cell_text(v)
+
+
+_TYPED_FORMATTERS = {
+    int: _format_int,
+    float: _format_float,
+    str: _format_str,
+    datetime: _format_datetime,
+    date: _format_datetime,
+}
 
 
 class ExcelSheetModel(QAbstractTableModel):
@@ -31,30 +120,64 @@ class ExcelSheetModel(QAbstractTableModel):
         * 편집은 좌상단만 가능하게 막음(데이터 꼬임 방지)
     """
 
+    # 헤더 라벨 공유 테이블 (0-index, 모든 모델이 함께 사용하며 필요한 만큼만 늘림)
+    _COL_NAMES: List[str] = []   # "A", "B", ..., "AA"
+    _ROW_LABELS: List[str] = []  # "1", "2", ...
+
+    # data()에서 처리하는 role (그 외 ToolTip/SizeHint/Font 등은 즉시 None)
+    _HANDLED_ROLES = frozenset(int(r) for r in (Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole))
+
     def __init__(self, ws, parent=None):
         super().__init__(parent)
         self.ws = ws
         self.max_row = ws.max_row
         self.max_col = ws.max_column
-
-        self.dirty: Dict[Tuple[int, int], Any] = {}
+        # 백그라운드 저장 중 잠금: 편집/실행취소 금지, ws에서 새 행을 읽지 않음 (set_sheet_locked)
+        self._sheet_locked: bool = False
+        # 원본 값 스냅샷(0-index 행 리스트): 표시할 때마다 ws.cell() 호출하지 않도록 읽어 둠
+        # - 시트 전체를 한 번에 읽지 않고, 화면에 필요한 행까지만 _ROW_CHUNK 단위로 채움
+        self._buf: List[list] = []
+        # 표시 문자열 캐시(_buf와 같은 모양, None이면 미계산)
+        # - 수식 셀은 다른 셀/필터 상태에 따라 결과가 바뀌므로 캐시하지 않음
+        self._str_cache: List[list] = []
+        self._load_rows_until(_FORMAT_SAMPLE_ROWS)
+        # 헤더 표시용 컬럼명(A, B, ..., AA) 미리 계산
+        self._ensure_col_names(self.max_col)
+
+        # 키: (r-1)*max_col + (c-1) 선형 인덱스 (조회 시 튜플 생성 방지), 복원은 _dirty_cell
+        self.dirty: Dict[int, Any] = {}
+        # 행 단위 dirty 마스크(1-index): 0인 행은 dirty dict 조회 자체를 건너뜀
+        # - 2차원(max_row*max_col) 마스크는 서식만 있는 시트에서 너무 커질 수 있어 행 단위로 둠
+        # - undo로 값이 빠져도 1로 남을 수 있음(있을 수도 있다는 의미, 최종 판정은 dict)
+        self._dirty_rows = bytearray(self.max_row + 1)
+        # 마지막 apply_dirty_to_sheet 이후 바뀐 편집이 있는지 (없으면 다시 반영하지 않음)
+        self._pending_apply: bool = False
         self.edit_all: bool = False
+        # 수정된 셀 배경(연노랑) - 호출마다 새로 만들지 않도록 1회 생성
+        self._dirty_brush = QBrush(QColor(255, 250, 205))
         self.editable_cols: set[int] = self._find_chargeback_rate_cols()
         
         # 필터 상태 확인용 proxy_model 참조 (SUBTOTAL 계산 시 필요)
         self.proxy_model = None
 
-        # (r,c) -> (top_r, top_c) 병합 캐시
-        self._merge_top_left: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # 선형 키((r-1)*max_col + (c-1), dirty와 동일) -> (top_r, top_c) 병합 캐시
+        self._merge_top_left: Dict[int, Tuple[int, int]] = {}
         # (top_r, top_c) -> (min_row, min_col, max_row, max_col) 병합 범위 캐시(최적화용)
         self._merge_bounds_by_top: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
 
         self._build_merge_cache()
+
+        # 컬럼별 표시 포맷터 (0-index)
+        self._col_formatters: list = self._build_col_formatters()
         
         # Undo/Redo 스택
         self._undo_stack: deque = deque(maxlen=100)  # 최대 100개까지 저장
         self._redo_stack: deque = deque(maxlen=100)
         self._is_undoing: bool = False  # Undo/Redo 중인지 플래그
+
+        # 일괄 편집(붙여넣기 등) 중에는 dataChanged를 모아서 끝날 때 한 번만 발생
+        self._batch_depth: int = 0
+        self._pending_rect: Optional[Tuple[int, int, int, int]] = None  # (top, left, bottom, right) 0-index
     
     def set_proxy_model(self, proxy_model):
         """필터 상태 확인을 위한 proxy_model 참조 설정"""
@@ -72,16 +195,127 @@ class ExcelSheetModel(QAbstractTableModel):
 
             for r in range(min_row, max_row + 1):
                 for c in range(min_col, max_col + 1):
-                    self._merge_top_left[(r, c)] = top
+                    self._merge_top_left[self._dirty_key(r, c)] = top
 
     def _canonical_cell(self, r: int, c: int) -> Tuple[int, int]:
         """병합셀 내부면 좌상단 좌표로, 아니면 자기 자신."""
-        return self._merge_top_left.get((r, c), (r, c))
+        if not self._merge_top_left:
+            return r, c
+        top = self._merge_top_left.get((r - 1) * self.max_col + (c - 1))
+        return (r, c) if top is None else top
 
     def _is_merged_non_topleft(self, r: int, c: int) -> bool:
         """병합 범위 안인데 좌상단이 아닌 셀인지"""
-        top = self._merge_top_left.get((r, c))
-        return (top is not None) and (top != (r, c))
+        if not self._merge_top_left:
+            return False
+        top = self._merge_top_left.get((r - 1) * self.max_col + (c - 1))
+        return (top is not None) and (top[0] != r or top[1] != c)
+
+    # ---------- 컬럼별 표시 포맷 ----------
+    def _build_col_formatters(self) -> list:
+        """
+        상단 일부 행을 샘플링해 컬럼별로 가장 많이 나온 타입의 포맷터를 선택
+        - 타입 판별을 셀마다 하지 않고 컬럼당 1회로 줄임
+        - 샘플에 값이 없거나 지원하지 않는 타입이면 _format_value 사용
+        """
+        counts: List[Dict[type, int]] = [{} for _ in range(self.max_col)]
+        for row in self._buf[:_FORMAT_SAMPLE_ROWS]:
+            for i, v in enumerate(row):
+                if v is None:
+                    continue
+                t = type(v)
+                counts[i][t] = counts[i].get(t, 0) + 1
+
+        formatters = []
+        for col_counts in counts:
+            if col_counts:
+                t = max(col_counts, key=col_counts.get)
+                formatters.append(_TYPED_FORMATTERS.get(t, self._format_value))
+            else:
+                formatters.append(self._format_value)
+        return formatters
+
+    # ---------- dirty 오버레이 ----------
+    def _row_may_be_dirty(self, r: int) -> bool:
+        return 0 < r <= self.max_row and self._dirty_rows[r] != 0
+
+    def _dirty_key(self, r: int, c: int) -> int:
+        return (r - 1) * self.max_col + (c - 1)
+
+    def _dirty_cell(self, key: int) -> Tuple[int, int]:
+        """선형 키 -> (r, c) (1-index)"""
+        r0, c0 = divmod(key, self.max_col)
+        return r0 + 1, c0 + 1
+
+    def _load_rows_until(self, r: int) -> None:
+        """스냅샷을 r행까지 채움 (최소 _ROW_CHUNK행씩 이어서 읽음)"""
+        loaded = len(self._buf)
+        if self._sheet_locked or r <= loaded or loaded >= self.max_row or self.max_col <= 0:
+            return
+        end = min(self.max_row, max(r, loaded + _ROW_CHUNK))
+        self._buf.extend(
+            list(row) for row in self.ws.iter_rows(
+                min_row=loaded + 1, max_row=end, max_col=self.max_col, values_only=True
+            )
+        )
+        self._str_cache.extend([None] * self.max_col for _ in range(end - loaded))
+
+    def _sheet_value(self, r: int, c: int) -> Any:
+        """원본 셀 값 (스냅샷 범위 밖이면 ws에서 직접 조회)"""
+        if len(self._buf) < r <= self.max_row:
+            self._load_rows_until(r)
+        if 0 < r <= len(self._buf):
+            row = self._buf[r - 1]
+            if 0 < c <= len(row):
+                return row[c - 1]
+        if self._sheet_locked:
+            # 저장 중에는 ws를 건드리지 않음 (ws.cell은 없는 셀을 만들기도 함) - 잠금 해제 후 다시 그림
+            return None
+        return self.ws.cell(row=r, column=c).value
+
+    def _value_at(self, r: int, c: int) -> Any:
+        """dirty를 반영한 셀 값 (수정 없는 행은 dict 조회 없이 스냅샷 값)"""
+        if self._row_may_be_dirty(r):
+            v = self.dirty.get((r - 1) * self.max_col + (c - 1), _MISSING)
+            if v is not _MISSING:
+                return v
+        return self._sheet_value(r, c)
+
+    def _set_dirty(self, r: int, c: int, v: Any) -> None:
+        self.dirty[self._dirty_key(r, c)] = v
+        if 0 < r <= self.max_row:
+            self._dirty_rows[r] = 1
+        self._pending_apply = True
+        self._invalidate_display(r, c)
+
+    def _clear_dirty(self, r: int, c: int) -> None:
+        self.dirty.pop(self._dirty_key(r, c), None)
+        self._pending_apply = True
+        self._invalidate_display(r, c)
+
+    def set_sheet_locked(self, locked: bool) -> None:
+        """
+        백그라운드 작업(저장)이 ws를 읽고 쓰는 동안 모델 잠금
+        - 잠금 중: 편집/붙여넣기/실행취소 거부, 아직 읽지 않은 행은 빈 값으로 표시
+        - 해제 시: 잠금 중 빈 값으로 그린 행을 다시 그리도록 전체 갱신
+        """
+        if self._sheet_locked == locked:
+            return
+        self._sheet_locked = locked
+        if not locked and self.max_row > 0 and self.max_col > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.max_row - 1, self.max_col - 1))
+
+    def is_sheet_locked(self) -> bool:
+        return self._sheet_locked
+
+    def has_pending_edits(self) -> bool:
+        """시트(ws)에 아직 반영하지 않은 편집이 있는지"""
+        return self._pending_apply
+
+    def _invalidate_display(self, r: int, c: int) -> None:
+        """값이 바뀐 셀의 표시 문자열 캐시 제거"""
+        if 0 < r <= len(self._str_cache) and 0 < c <= self.max_col:
+            self._str_cache[r - 1][c - 1] = None
 
     # ----- Qt 필수 -----
     def rowCount(self, parent=QModelIndex()):
@@ -91,22 +325,37 @@ class ExcelSheetModel(QAbstractTableModel):
         return self.max_col
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid():
+        if role not in self._HANDLED_ROLES or not index.isValid():
             return None
 
         r = index.row() + 1
         c = index.column() + 1
 
+        # 표시 문자열 캐시를 가장 먼저 확인 (repaint 대부분이 여기서 끝남)
+        # - 병합 내부 셀은 아래에서 ""로 캐시되므로 병합 검사보다 먼저 봐도 결과 동일
+        if role == Qt.DisplayRole and r <= len(self._str_cache):
+            cached = self._str_cache[r - 1][c - 1]
+            if cached is not None:
+                return cached
+
         # 병합된 셀의 경우, 좌상단이 아닌 셀에서는 빈 문자열 반환
         if self._is_merged_non_topleft(r, c):
             if role == Qt.DisplayRole or role == Qt.EditRole:
+                if role == Qt.DisplayRole and r <= len(self._str_cache):
+                    self._str_cache[r - 1][c - 1] = ""
                 return ""
             return None
 
-        # 병합이면 좌상단 기준으로 값 조회
-        cr, cc = self._canonical_cell(r, c)
+        # 여기까지 온 셀은 병합 좌상단이거나 병합 밖이므로 자기 자신이 기준 셀
+        cr, cc = r, c
 
-        v = self.dirty.get((cr, cc), self.ws.cell(row=cr, column=cc).value)
+        if role == Qt.BackgroundRole:
+            # 수정된 셀 표시(병합이면 좌상단 기준)
+            if self._row_may_be_dirty(cr) and self._dirty_key(cr, cc) in self.dirty:
+                return self._dirty_brush
+            return None
+
+        v = self._value_at(cr, cc)
 
         if role == Qt.EditRole:
             return "" if v is None else v
@@ -114,14 +363,10 @@ class ExcelSheetModel(QAbstractTableModel):
         if role == Qt.DisplayRole:
             # 수식이면 표시용으로 계산값을 보여주고, 아니면 원래 값 표시
             v_display = self._display_value(v, r=cr, c=cc)
-            return self._format_value(v_display)
-
-        if role == Qt.BackgroundRole:
-            # 수정된 셀 표시(병합이면 좌상단 기준)
-            if (cr, cc) in self.dirty:
-                from PySide6.QtGui import QBrush, QColor
-                return QBrush(QColor(255, 250, 205))  # 연노랑
-            return None
+            text = self._col_formatters[cc - 1](v_display)
+            if cr <= len(self._str_cache) and not (isinstance(v, str) and v.lstrip().startswith("=")):
+                self._str_cache[cr - 1][cc - 1] = text
+            return text
 
         return None
 
@@ -133,8 +378,8 @@ class ExcelSheetModel(QAbstractTableModel):
         c = index.column() + 1
         base = Qt.ItemIsSelectable | Qt.ItemIsEnabled
 
-        # 헤더 행(1행)은 편집 막기
-        if r == 1:
+        # 헤더 행(1행)은 편집 막기, 저장 중에도 편집 막기
+        if r == 1 or self._sheet_locked:
             return base
 
         # 병합셀은 좌상단만 편집 가능
@@ -151,7 +396,7 @@ class ExcelSheetModel(QAbstractTableModel):
         return base
 
     def setData(self, index, value, role=Qt.EditRole):
-        if role != Qt.EditRole or not index.isValid():
+        if role != Qt.EditRole or not index.isValid() or self._sheet_locked:
             return False
 
         r = index.row() + 1
@@ -171,10 +416,10 @@ class ExcelSheetModel(QAbstractTableModel):
             return False
 
         # 현재 값 가져오기 (편집 전 값)
-        old_val = self.dirty.get((cr, cc))
-        if old_val is None:
-            # dirty에 없으면 원본 워크시트에서 가져오기
-            old_val = self.ws.cell(row=cr, column=cc).value
+        old_val = self.dirty.get(self._dirty_key(cr, cc), _MISSING)
+        if old_val is _MISSING:
+            # dirty에 없으면 원본 값에서 가져오기
+            old_val = self._sheet_value(cr, cc)
 
         new_val = self._parse_user_input(value)
         
@@ -191,26 +436,69 @@ class ExcelSheetModel(QAbstractTableModel):
                 # 새 편집이 발생하면 redo 스택 초기화
                 self._redo_stack.clear()
         
-        self.dirty[(cr, cc)] = new_val
+        self._set_dirty(cr, cc, new_val)
 
         # 병합 범위가 있으면 범위만 갱신(최소 갱신)
-        top = (cr, cc)
-        if top in self._merge_bounds_by_top:
-            min_row, min_col, max_row, max_col = self._merge_bounds_by_top[top]
-            tl = self.index(min_row - 1, min_col - 1)
-            br = self.index(max_row - 1, max_col - 1)
-            self.dataChanged.emit(tl, br, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
-        else:
-            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+        self._emit_cell_changed(cr, cc)
 
         return True
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role != Qt.DisplayRole:
             return None
+        if section < 0:
+            return None
         if orientation == Qt.Horizontal:
-            return self.excel_col_name(section + 1)
-        return str(section + 1)
+            if section >= len(self._COL_NAMES):
+                self._ensure_col_names(section + 1)
+            return self._COL_NAMES[section]
+        labels = self._ROW_LABELS
+        if section >= len(labels):
+            labels.extend(str(i) for i in range(len(labels) + 1, section + 2))
+        return labels[section]
+
+    @classmethod
+    def _ensure_col_names(cls, n: int) -> None:
+        """공유 컬럼명 테이블을 n개까지 채움"""
+        names = cls._COL_NAMES
+        if len(names) < n:
+            names.extend(cls.excel_col_name(i) for i in range(len(names) + 1, n + 1))
+
+    # ----- 변경 알림 -----
+    _CHANGED_ROLES = [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole]
+
+    def _emit_cell_changed(self, r: int, c: int) -> None:
+        """셀(병합이면 병합 범위 전체) 변경 알림 (1-index), 일괄 편집 중이면 범위만 누적"""
+        bounds = self._merge_bounds_by_top.get((r, c))
+        if bounds:
+            min_row, min_col, max_row, max_col = bounds
+        else:
+            min_row, min_col, max_row, max_col = r, c, r, c
+        top, left, bottom, right = min_row - 1, min_col - 1, max_row - 1, max_col - 1
+
+        if self._batch_depth > 0:
+            if self._pending_rect is None:
+                self._pending_rect = (top, left, bottom, right)
+            else:
+                pt, pl, pb, pr = self._pending_rect
+                self._pending_rect = (min(pt, top), min(pl, left), max(pb, bottom), max(pr, right))
+            return
+
+        self.dataChanged.emit(self.index(top, left), self.index(bottom, right), self._CHANGED_ROLES)
+
+    def begin_batch(self) -> None:
+        """일괄 편집 시작 (end_batch까지 dataChanged 보류)"""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """일괄 편집 종료: 보류된 변경 범위를 dataChanged 한 번으로 알림"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending_rect is not None:
+            top, left, bottom, right = self._pending_rect
+            self._pending_rect = None
+            self.dataChanged.emit(self.index(top, left), self.index(bottom, right), self._CHANGED_ROLES)
 
     # ----- 유틸 -----
     def set_edit_all(self, on: bool):
@@ -218,12 +506,12 @@ class ExcelSheetModel(QAbstractTableModel):
     
     # ================= Undo/Redo =================
     def can_undo(self) -> bool:
-        """실행취소 가능한지 확인"""
-        return len(self._undo_stack) > 0
+        """실행취소 가능한지 확인 (저장 중에는 불가)"""
+        return not self._sheet_locked and len(self._undo_stack) > 0
     
     def can_redo(self) -> bool:
-        """다시실행 가능한지 확인"""
-        return len(self._redo_stack) > 0
+        """다시실행 가능한지 확인 (저장 중에는 불가)"""
+        return not self._sheet_locked and len(self._redo_stack) > 0
     
     def undo(self) -> bool:
         """마지막 편집을 실행취소"""
@@ -249,23 +537,15 @@ class ExcelSheetModel(QAbstractTableModel):
             })
             
             # 값 복원
-            if old_val is None:
-                # 원래 값이 None이면 dirty에서 제거
-                if (row, col) in self.dirty:
-                    del self.dirty[(row, col)]
+            if old_val is None and self._sheet_value(row, col) is None:
+                # 원래 값이 None이고 시트도 아직 None이면 dirty에서 제거
+                # (시트 전환/저장으로 이미 ws에 반영됐다면 None을 dirty로 남겨 다음 반영 때 되돌림)
+                self._clear_dirty(row, col)
             else:
-                self.dirty[(row, col)] = old_val
+                self._set_dirty(row, col, old_val)
             
             # UI 업데이트
-            index = self.index(row - 1, col - 1)
-            top = (row, col)
-            if top in self._merge_bounds_by_top:
-                min_row, min_col, max_row, max_col = self._merge_bounds_by_top[top]
-                tl = self.index(min_row - 1, min_col - 1)
-                br = self.index(max_row - 1, max_col - 1)
-                self.dataChanged.emit(tl, br, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
-            else:
-                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+            self._emit_cell_changed(row, col)
             
             return True
         finally:
@@ -294,18 +574,10 @@ class ExcelSheetModel(QAbstractTableModel):
             })
             
             # 값 적용
-            self.dirty[(row, col)] = new_val
+            self._set_dirty(row, col, new_val)
             
             # UI 업데이트
-            index = self.index(row - 1, col - 1)
-            top = (row, col)
-            if top in self._merge_bounds_by_top:
-                min_row, min_col, max_row, max_col = self._merge_bounds_by_top[top]
-                tl = self.index(min_row - 1, min_col - 1)
-                br = self.index(max_row - 1, max_col - 1)
-                self.dataChanged.emit(tl, br, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
-            else:
-                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+            self._emit_cell_changed(row, col)
             
             return True
         finally:
@@ -319,20 +591,7 @@ class ExcelSheetModel(QAbstractTableModel):
             name = chr(65 + rem) + name
         return name
 
-    @staticmethod
-    def _format_value(v):
-        if v is None:
-            return ""
-        if isinstance(v, bool):
-            return "TRUE" if v else "FALSE"
-        if isinstance(v, int):
-            return f"{v:,}"
-        if isinstance(v, float):
-            # 모든 float는 정수로 반올림하여 표시 (엑셀 스타일)
-            return f"{int(round(v)):,}"
-        if isinstance(v, (datetime, date)):
-            return v.strftime("%Y-%m-%d")
-        return str(v)
+    _format_value = staticmethod(_format_cell_text)
 
     @staticmethod
     def _parse_user_input(value):
@@ -342,25 +601,27 @@ class ExcelSheetModel(QAbstractTableModel):
 
         raw = text.replace(",", "")
 
-        try:
-            if "." in raw:
-                return float(raw)
-            return int(raw)
-        except ValueError:
+        # 숫자 형태가 아니면 예외 처리 없이 바로 문자열로
+        m = _NUMBER_RE.fullmatch(raw)
+        if m is None:
             return text
+        return float(raw) if m.lastindex else int(raw)
 
     def _find_chargeback_rate_cols(self) -> set[int]:
         """
         1행(헤더)에서 '구상'+'율' 포함 컬럼을 찾아 편집 가능 컬럼으로 등록
         """
-        editable = set()
-        header_row = 1
+        if not self._buf:
+            return set()
 
-        for c in range(1, self.max_col + 1):
-            hv = self.ws.cell(row=header_row, column=c).value
+        # 셀 단위 ws.cell 접근 대신 스냅샷의 헤더 행 사용
+        header = self._buf[0]
+        editable = set()
+        for c, hv in enumerate(header, start=1):
             if hv and isinstance(hv, str):
                 s = hv.replace(" ", "")
-                if ("구상" in s and "율" in s) or ("chargeback" in hv.lower() and "rate" in hv.lower()):
+                low = hv.lower()
+                if ("구상" in s and "율" in s) or ("chargeback" in low and "rate" in low):
                     editable.add(c)
         return editable
 
@@ -368,9 +629,29 @@ class ExcelSheetModel(QAbstractTableModel):
         """
         dirty를 실제 ws에 반영
         - 병합셀의 경우 dirty는 항상 좌상단 기준으로만 기록됨
+        - 저장/전처리 시 백그라운드 쓰레드에서 호출되므로, UI 편집과 겹쳐도
+          안전하도록 항목을 먼저 복사한 뒤 기록
         """
-        for (r, c), v in self.dirty.items():
-            self.ws.cell(row=r, column=c).value = v
+        if not self._pending_apply or not self.dirty:
+            return
+        # 반영 도중 들어온 편집은 다시 True로 만들어 다음 반영 때 기록되도록 먼저 내림
+        self._pending_apply = False
+        # 이미 존재하는 셀은 ws 내부 셀 dict에서 바로 꺼내 씀 (ws.cell의 좌표 검사/생성 과정 생략)
+        # 키 정렬 = 행 우선 순서라 같은 행의 셀을 연달아 기록
+        cells = getattr(self.ws, "_cells", None)
+        dirty = self.dirty
+        for key in sorted(dirty):  # 정수 키만 정렬 (키 목록이 곧 스냅샷)
+            v = dirty.get(key, _MISSING)
+            if v is _MISSING:  # 반영 도중 실행취소로 빠진 항목
+                continue
+            r, c = self._dirty_cell(key)
+            cell = cells.get((r, c)) if cells is not None else None
+            if cell is None:
+                cell = self.ws.cell(row=r, column=c)
+            cell.value = v
+            # 스냅샷도 ws와 같게 유지
+            if 0 < r <= len(self._buf) and 0 < c <= len(self._buf[r - 1]):
+                self._buf[r - 1][c - 1] = v
         # dirty 유지(화면 표시/후속 반영용)
     def _display_value(self, v: Any, r: int, c: int) -> Any:
         """
@@ -406,8 +687,7 @@ class ExcelSheetModel(QAbstractTableModel):
                 ref_addr = cell_ref_match.group(1).upper()
                 ref_row, ref_col = self._addr_to_row_col(ref_addr)
                 # 참조된 셀의 값 읽기 (재귀적으로 수식 계산)
-                ref_cell = self.ws.cell(row=ref_row, column=ref_col)
-                ref_value = self.dirty.get((ref_row, ref_col), ref_cell.value)
+                ref_value = self._value_at(ref_row, ref_col)
                 # 참조된 값이 수식이면 재귀적으로 계산
                 if isinstance(ref_value, str) and ref_value.strip().startswith("="):
                     return self._display_value(ref_value, ref_row, ref_col)
@@ -473,7 +753,7 @@ class ExcelSheetModel(QAbstractTableModel):
         # 병합이면 좌상단으로 정규화
         row, col = self._canonical_cell(row, col)
 
-        vv = self.dirty.get((row, col), self.ws.cell(row=row, column=col).value)
+        vv = self._value_at(row, col)
 
         if vv is None:
             return 0.0
@@ -587,7 +867,7 @@ class ExcelSheetModel(QAbstractTableModel):
         # 병합이면 좌상단으로 정규화
         row, col = self._canonical_cell(row, col)
         
-        vv = self.dirty.get((row, col), self.ws.cell(row=row, column=col).value)
+        vv = self._value_at(row, col)
         
         if vv is None:
             return 0.0
@@ -3,7 +3,7 @@ comex 관리 페이지 - 협력사 목록 및 룰 관리
 """
 from typing import Dict, Any, Optional, List
 
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QRegularExpression
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QRegularExpression, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
     QListWidget, QListWidgetItem, QMessageBox, QDialog, QTableWidget,
@@ -92,7 +92,7 @@ class RuleManagementWidget(QWidget):
         layout.setSpacing(8)
         
         # 제목
-        from PySide6.QtWidgets import QLabel, QGroupBox, QTextEdit
+        from PySide6.QtWidgets import QLabel, QGroupBox, QPlainTextEdit
         self.title_label = QLabel("협력사를 선택하세요")
         self.title_label.setStyleSheet("font-size: 10pt; font-weight: normal;")
         layout.addWidget(self.title_label)
@@ -100,7 +100,7 @@ class RuleManagementWidget(QWidget):
         # 상단: Remark 영역
         remark_group = QGroupBox("Remark")
         remark_layout = QVBoxLayout()
-        self.remark_text = QTextEdit()
+        self.remark_text = QPlainTextEdit()
         self.remark_text.setReadOnly(False)  # 편집 가능
         self.remark_text.setMaximumHeight(100)
         remark_layout.addWidget(self.remark_text)
@@ -178,7 +178,10 @@ class RuleManagementWidget(QWidget):
         # Remark 표시
         remark = company_info.get("remark", "")
         self.original_remark = remark if remark else ""
-        self.remark_text.setText(self.original_remark)
+        # 프로그램에서 채우는 값은 편집이 아니므로 on_remark_changed를 거치지 않음
+        self.remark_text.blockSignals(True)
+        self.remark_text.setPlainText(self.original_remark)
+        self.remark_text.blockSignals(False)
         self.current_sap_code = company_info.get("sap_code")
         self.btn_save_remark.setEnabled(False)  # 초기에는 저장 버튼 비활성화
         
@@ -653,18 +656,28 @@ class ComExManagementPageWidget(QWidget):
         # 이벤트 연결
         self.btn_add_company.clicked.connect(self.on_add_company)
         self.company_list.itemClicked.connect(self.on_company_selected)
-        self.search_edit.textChanged.connect(self.on_search_changed)
-        
-        # 초기화
-        self.load_companies()
+        # 검색 입력 디바운스 (타이핑이 멈춘 뒤 한 번만 목록 필터링)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+        self.search_edit.textChanged.connect(lambda _: self._search_timer.start())
+        
+        # 협력사 목록은 DB 초기화 완료 후 MainWindow에서 load_companies() 호출
+        self.company_data = {}  # sap_name -> {sap_code, sap_name} 매핑
     
     def load_companies(self):
         """협력사 목록 로드 (sap_code와 sap_name 저장)"""
+        companies = get_all_companies_with_code()
+
+        # 목록이 그대로면 다시 만들지 않음 (선택/스크롤 위치 유지)
+        current = [(d["sap_name"], d["sap_code"]) for d in self.company_data.values()]
+        if current and current == [(c["sap_name"], c["sap_code"]) for c in companies]:
+            return
+
         self.company_list.clear()
         self.company_data = {}  # sap_name -> {sap_code, sap_name} 매핑
         
-        companies = get_all_companies_with_code()
-        
         for company in companies:
             sap_name = company["sap_name"]
             sap_code = company["sap_code"]
@@ -677,6 +690,10 @@ class ComExManagementPageWidget(QWidget):
         # 검색 필터 적용
         self.on_search_changed(self.search_edit.text())
     
+    def _on_search_timeout(self):
+        """검색 입력이 멈춘 뒤 현재 검색어로 목록 필터링"""
+        self.on_search_changed(self.search_edit.text())
+    
     def on_search_changed(self, text: str):
         """검색어 변경 시 필터링 (대소문자 구분 없이, sap_code와 sap_name 모두 검색)"""
         search_text = text.strip().lower()
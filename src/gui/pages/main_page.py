@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
 
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QRegularExpression, QStringListModel, QModelIndex, QThread, Signal
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFileDialog, QMessageBox,
     QAbstractItemView, QMenu, QSplitter, QDialog, QApplication
 )
 
-from openpyxl.workbook.workbook import Workbook
-
 from src.utils import load_workbook_safe, save_workbook_safe, AppError
-from src.excel_processor import preprocess_inplace
 from src.database import (
     get_company_info, get_all_companies, get_all_companies_with_code,
     get_rules_from_table, add_rule_to_table
@@ -23,25 +21,11 @@ from src.gui.containers import (
 from src.gui.models import ExcelSheetModel
 from src.gui.excel_filter import ExcelFilterProxyModel, ColumnFilterDialog, ColumnSelectDialog
 from src.gui.dialogs import AddRuleDialog
+from src.gui.workers import WorkerThread
 
-
-class WorkerThread(QThread):
-    """긴 작업을 처리할 백그라운드 쓰레드"""
-    finished = Signal(object)
-    error = Signal(str)
-
-    def __init__(self, task_fn, *args, **kwargs):
-        super().__init__()
-        self.task_fn = task_fn
-        self.args = args
-        self.kwargs = kwargs
-
-    def run(self):
-        try:
-            result = self.task_fn(*self.args, **self.kwargs)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+if TYPE_CHECKING:
+    # openpyxl/전처리 모듈은 파일을 열거나 전처리할 때 import (앱 시작 시간 단축)
+    from openpyxl.workbook.workbook import Workbook
 
 
 class MainPageWidget(QWidget):
@@ -56,10 +40,26 @@ class MainPageWidget(QWidget):
         self.wb_overseas: Workbook | None = None
         self.model: ExcelSheetModel | None = None
         self.proxy: QSortFilterProxyModel | None = None
+        # 시트 표시명("국내: Sheet1") -> 모델 캐시 (시트 전환 시 재생성 방지)
+        self._model_cache: Dict[str, ExcelSheetModel] = {}
+        # 시트 표시명 -> (컬럼 너비 [(col, w)], 행 높이 [(row, h)]) 레이아웃 캐시
+        # - 시트 전환 시 column/row_dimensions를 다시 훑지 않고, 사용자가 조정한 컬럼 너비도 유지
+        self._layout_cache: Dict[str, Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]] = {}
+        self._current_sheet: str | None = None
         self.current_company_info: Dict[str, Any] | None = None
+        # 마지막으로 불러온 회사 입력값 (같은 값으로 다시 들어오면 DB 조회 생략)
+        self._last_company: str | None = None
+        # 백그라운드 저장 중 여부 (True인 동안 워크북/모델을 바꾸는 작업은 모두 막음)
+        self._saving: bool = False
+        # 저장 중 검색어가 바뀌어 필터 적용을 미뤘는지
+        self._search_deferred: bool = False
         # 전처리 상태 추적
         self.preprocessed_domestic: bool = False
         self.preprocessed_overseas: bool = False
+        # 검색 입력 디바운스 (타이핑 중에는 필터를 다시 돌리지 않음)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(300)
 
         # ================= 컨테이너 생성 =================
         self.control_panel = ControlPanel(self)
@@ -98,13 +98,16 @@ class MainPageWidget(QWidget):
 
         self.setLayout(layout)
 
+        # 탐색기에서 .xlsx 파일을 끌어다 놓아 업로드
+        self.setAcceptDrops(True)
+
         self._connect_signals()
         self._initialize()
 
     # ================= 초기화 =================
     def _initialize(self):
         self.info_panel.set_remark("-")
-        self.load_companies()
+        # 협력사 목록은 DB 초기화 완료 후 MainWindow에서 load_companies() 호출
         # 초기 전처리 버튼 상태 설정
         self._update_preprocess_button_state()
 
@@ -113,17 +116,28 @@ class MainPageWidget(QWidget):
         self.control_panel.get_upload_overseas_button().clicked.connect(lambda: self.open_file("overseas"))
         self.control_panel.get_preprocess_button().clicked.connect(self.on_preprocess_clicked)
         # 검색창에서 Enter 키 또는 편집 완료 시 회사 선택
+        # (editingFinished는 Enter에서도 발생하므로 returnPressed까지 연결하면 DB 조회가 두 번 일어남)
         self.control_panel.get_company_edit().editingFinished.connect(self._on_company_search_finished)
-        self.control_panel.get_company_edit().returnPressed.connect(self._on_company_search_finished)
         # 자동완성 목록에서 항목 선택 시
         self.control_panel.get_company_completer().activated.connect(self._on_company_selected_from_completer)
-        self.control_panel.get_search_edit().textChanged.connect(self.on_search_changed)
+        self.control_panel.get_search_edit().textChanged.connect(lambda _: self._search_timer.start())
+        self._search_timer.timeout.connect(self._on_search_timeout)
         self.control_panel.get_edit_all_checkbox().stateChanged.connect(self.on_edit_mode_changed)
         
         # 실행취소/다시실행 버튼 연결
         self.control_panel.get_undo_button().clicked.connect(self.on_undo)
         self.control_panel.get_redo_button().clicked.connect(self.on_redo)
 
+        # 미리보기 테이블 붙여넣기 (셀 편집 중에는 편집기가 직접 처리)
+        table = self.preview_container.get_table()
+        self._paste_shortcut = QShortcut(QKeySequence.Paste, table)
+        self._paste_shortcut.setContext(Qt.WidgetShortcut)
+        self._paste_shortcut.activated.connect(self.on_paste)
+        # 헤더 우클릭 메뉴 (헤더 객체는 모델이 바뀌어도 유지되므로 1회만 연결)
+        header = table.horizontalHeader()
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        header.customContextMenuRequested.connect(self._on_header_context_menu)
+
         self.control_panel.get_sheet_combo().currentTextChanged.connect(self.on_sheet_changed)
         self.control_panel.get_export_final_button().clicked.connect(self.save_as_file)
         self.control_panel.get_filter_button().clicked.connect(self.on_filter_button_clicked)
@@ -143,10 +157,8 @@ class MainPageWidget(QWidget):
                 # "이름 (코드)" 형식만 추가
                 company_list.append(f"{sap_name} ({sap_code})")
             
-            # QCompleter에 모델 설정
-            model = QStringListModel(company_list, self)
-            completer = self.control_panel.get_company_completer()
-            completer.setModel(model)
+            # 자동완성 목록 갱신 (모델은 ControlPanel이 보유)
+            self.control_panel.set_companies(company_list)
 
     def _on_company_search_finished(self):
         """검색창에서 Enter 키 또는 편집 완료 시 호출"""
@@ -171,12 +183,21 @@ class MainPageWidget(QWidget):
         # 그 외의 경우는 그대로 반환 (직접 입력한 경우: 이름 또는 코드)
         return text
     
-    def _on_company_changed(self, name: str):
-        """회사 선택 시 정보 로드"""
+    def _on_company_changed(self, name: str, force: bool = False):
+        """
+        회사 선택 시 정보 로드
+        Args:
+            force: True면 같은 회사여도 다시 조회 (규칙 추가 후 갱신 등)
+        """
+        # 자동완성 선택 + 편집 완료가 연달아 들어오는 경우 등 중복 조회 방지
+        if not force and name == self._last_company:
+            return
+
         if not name:
             self.info_panel.set_company_info("", "")
             self.info_panel.set_rules([])
             self.current_company_info = None
+            self._last_company = name
             return
 
         company_info = get_company_info(name)
@@ -186,6 +207,7 @@ class MainPageWidget(QWidget):
             return
 
         self.current_company_info = company_info
+        self._last_company = name
 
         # 회사 정보
         self.info_panel.set_company_info(
@@ -204,6 +226,14 @@ class MainPageWidget(QWidget):
         else:
             self.info_panel.set_rules([])
 
+    def invalidate_company_view(self):
+        """
+        InfoPanel이 더 이상 선택된 회사의 최신 정보를 보여주지 않을 때 호출
+        - 상태 문구로 Remark를 덮어쓴 경우, 다른 페이지에서 Remark/규칙을 수정했을 수 있는 경우
+        - 같은 회사를 다시 선택해도 DB에서 다시 조회하도록 마지막 선택값을 지움
+        """
+        self._last_company = None
+
     # ================= Rule 추가 =================
     def add_rule(self):
         if not self.current_company_info:
@@ -221,7 +251,8 @@ class MainPageWidget(QWidget):
                 add_rule_to_table(rule_table_name=rule_table_name, **dialog.get_data())
                 QMessageBox.information(self, "완료", "규칙이 추가되었습니다.")
                 self._on_company_changed(
-                    self.control_panel.get_company_edit().text().strip()
+                    self._extract_company_name_or_code(self.control_panel.get_company_edit().text()),
+                    force=True
                 )
             except Exception as e:
                 QMessageBox.critical(self, "오류", str(e))
@@ -240,8 +271,12 @@ class MainPageWidget(QWidget):
         if not path:
             return
 
-        file_path = Path(path)
-        
+        self._open_path(Path(path), file_type)
+
+    def _open_path(self, file_path: Path, file_type: str):
+        """선택/드롭된 파일을 백그라운드에서 로드"""
+        if self._saving:
+            return
         # 로딩 애니메이션 표시
         self.preview_container.show_loading("파일을 불러오는 중")
         
@@ -251,8 +286,52 @@ class MainPageWidget(QWidget):
         self.load_worker.error.connect(self._on_worker_error)
         self.load_worker.start()
 
+    # ---------- 드래그 앤 드롭 업로드 ----------
+    def dragEnterEvent(self, event):
+        if not self._saving and self._dropped_xlsx_path(event.mimeData()) is not None:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        file_path = self._dropped_xlsx_path(event.mimeData())
+        if file_path is None or self._saving:
+            event.ignore()
+            return
+        event.acceptProposedAction()
+
+        # 국내/해외 구분은 드롭만으로 알 수 없으므로 선택받음
+        box = QMessageBox(self)
+        box.setWindowTitle("청구서 구분")
+        box.setText(f"{file_path.name}\n어느 청구서로 불러올까요?")
+        btn_domestic = box.addButton("국내", QMessageBox.AcceptRole)
+        btn_overseas = box.addButton("해외", QMessageBox.AcceptRole)
+        box.addButton("취소", QMessageBox.RejectRole)
+        box.exec()
+
+        clicked = box.clickedButton()
+        if clicked is btn_domestic:
+            self._open_path(file_path, "domestic")
+        elif clicked is btn_overseas:
+            self._open_path(file_path, "overseas")
+
+    @staticmethod
+    def _dropped_xlsx_path(mime) -> Path | None:
+        """드롭 데이터에서 첫 번째 로컬 .xlsx 파일 경로 (없으면 None)"""
+        if not mime.hasUrls():
+            return None
+        for url in mime.urls():
+            if url.isLocalFile():
+                p = Path(url.toLocalFile())
+                if p.suffix.lower() == ".xlsx":
+                    return p
+        return None
+
     def _on_load_finished(self, wb, file_type, file_path):
         """파일 로드 완료 시 호출되는 콜백"""
+        # 이전 워크북 기준으로 만든 모델 캐시 제거
+        self._invalidate_model_cache(file_type)
+
         # 워크북 저장
         if file_type == "domestic":
             self.file_path_domestic = file_path
@@ -291,6 +370,7 @@ class MainPageWidget(QWidget):
         
         remark = f"{'국내' if file_type == 'domestic' else '해외'} 청구서 업로드 완료. 전처리 전 상태"
         self.info_panel.set_remark(remark)
+        self.invalidate_company_view()  # Remark 패널을 상태 문구로 덮어썼으므로
         
         # 모든 처리가 끝난 후 로딩 애니메이션 숨김
         QApplication.processEvents()
@@ -298,21 +378,16 @@ class MainPageWidget(QWidget):
     
     def _update_sheet_list(self):
         """시트 목록 업데이트 (국내/해외 모두 포함)"""
-        sheet_combo = self.control_panel.get_sheet_combo()
-        sheet_combo.blockSignals(True)
-        sheet_combo.clear()
-        
-        # 국내 청구서 시트 추가
+        names = []
+        # 국내 청구서 시트
         if self.wb_domestic:
-            for sheet_name in self.wb_domestic.sheetnames:
-                sheet_combo.addItem(f"국내: {sheet_name}")
-        
-        # 해외 청구서 시트 추가
+            names.extend(f"국내: {sheet_name}" for sheet_name in self.wb_domestic.sheetnames)
+        # 해외 청구서 시트
         if self.wb_overseas:
-            for sheet_name in self.wb_overseas.sheetnames:
-                sheet_combo.addItem(f"해외: {sheet_name}")
-        
-        sheet_combo.blockSignals(False)
+            names.extend(f"해외: {sheet_name}" for sheet_name in self.wb_overseas.sheetnames)
+
+        # 시트 목록이 그대로면 콤보박스를 다시 만들지 않음
+        self.control_panel.set_sheet_names(names)
     
     def _load_sheet_from_combo(self):
         """시트 콤보박스에서 선택한 시트 로드"""
@@ -348,29 +423,43 @@ class MainPageWidget(QWidget):
             return
 
         ws = wb[actual_sheet_name]
-        self.model = ExcelSheetModel(ws, parent=self)
+        model = self._model_cache.get(sheet_display_name)
+
+        # 이미 표시 중인 시트면 모델/뷰를 다시 구성하지 않음
+        if (model is not None and model is self.model and model.ws is ws
+                and self.proxy is not None
+                and self.preview_container.get_table().model() is self.proxy):
+            return
+
+        # 떠나는 시트의 현재 컬럼 너비 기억
+        self._remember_column_widths()
+
+        if model is None or model.ws is not ws:
+            model = ExcelSheetModel(ws, parent=self)
+            # 모델의 dataChanged 시그널에 연결하여 편집 시 버튼 상태 업데이트 (생성 시 1회만)
+            model.dataChanged.connect(self._on_data_changed)
+            self._model_cache[sheet_display_name] = model
+        self.model = model
 
         edit_all = self.control_panel.get_edit_all_checkbox().isChecked()
         self.model.set_edit_all(edit_all)
 
+        # 이전 proxy는 뷰에서 내린 뒤 정리 (캐시된 모델에 연결된 채로 쌓이지 않도록)
+        old_proxy = self.proxy
         self.proxy = ExcelFilterProxyModel(self)
         self.proxy.setSourceModel(self.model)
-        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy.setFilterKeyColumn(-1)
         
         # model에 proxy 참조 설정 (SUBTOTAL 계산 시 필터 상태 확인용)
         self.model.set_proxy_model(self.proxy)
 
+        # 모델 교체 (정렬 비활성/갱신 중지 상태에서 1회 교체, delegate는 PreviewContainer에서 1회 설정한 것 유지)
+        self.preview_container.load_model(self.proxy)
         table = self.preview_container.get_table()
-        table.clearSpans()
-        table.setModel(self.proxy)
-        
-        # setModel 후 delegate 다시 설정 (말줄임표 방지)
-        from src.gui.containers.preview_container import NoElideDelegate
-        table.setItemDelegate(NoElideDelegate(table))
+        if old_proxy is not None:
+            old_proxy.setSourceModel(None)
+            old_proxy.deleteLater()
 
         table.setAlternatingRowColors(True)
-        table.setSortingEnabled(False)  # 컬럼 헤더 클릭 정렬 비활성화
         table.setSelectionBehavior(QAbstractItemView.SelectItems)
         table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         
@@ -379,80 +468,96 @@ class MainPageWidget(QWidget):
         
         # Undo/Redo 버튼 상태 업데이트
         self._update_undo_redo_buttons()
-        
-        # 모델의 dataChanged 시그널에 연결하여 편집 시 버튼 상태 업데이트
-        if self.model:
-            self.model.dataChanged.connect(self._on_data_changed)
-
-        header = table.horizontalHeader()
-        header.setContextMenuPolicy(Qt.CustomContextMenu)
-        header.customContextMenuRequested.connect(self._on_header_context_menu)
 
-        # 엑셀 레이아웃 먼저 적용
-        self._apply_excel_layout(ws)
-        QApplication.processEvents()
-        
-        # 내용에 맞게 컬럼 너비와 행 높이 자동 조정
-        table.resizeColumnsToContents()
+        # 엑셀 레이아웃 적용 (지정된 컬럼 너비/행 높이, 병합)
+        # - 내용 기반 너비 계산(resizeColumnsToContents)은 전체 행을 훑으므로 사용하지 않음
+        self._apply_excel_layout(ws, sheet_display_name)
+        self._current_sheet = sheet_display_name
         QApplication.processEvents()
-        table.resizeRowsToContents()
-        QApplication.processEvents()
-        
-        # 컬럼 너비: 엑셀 원본보다 작아지지 않도록
-        col_count = self.proxy.columnCount()
-        for col_idx in range(col_count):
-            if col_idx % 10 == 0:  # 10개 컬럼마다 UI 이벤트 처리
-                QApplication.processEvents()
-            current_width = table.columnWidth(col_idx)
-            excel_col_name = ExcelSheetModel.excel_col_name(col_idx + 1)
-            dim = ws.column_dimensions.get(excel_col_name)
-            if dim and dim.width:
-                excel_width = int(dim.width * 7 + 12)
-                table.setColumnWidth(col_idx, max(current_width, excel_width))
         
-        # 행 높이: 엑셀 원본보다 작아지지 않도록
-        row_count = self.proxy.rowCount()
-        # 행이 많을 수 있으므로 샘플링하거나 처리 속도 최적화
-        if row_count < 1000:  # 행이 너무 많으면 생략하거나 최적화
-            for row_idx in range(row_count):
-                if row_idx % 50 == 0:
-                    QApplication.processEvents()
-                current_height = table.rowHeight(row_idx)
-                dim = ws.row_dimensions.get(row_idx + 1)
-                if dim and dim.height:
-                    excel_height = int(dim.height * 1.33)
-                    table.setRowHeight(row_idx, max(current_height, excel_height))
-
         self.on_search_changed(self.control_panel.get_search_edit().text())
         QApplication.processEvents()
 
+    def _invalidate_model_cache(self, file_type: str) -> None:
+        """해당 파일(국내/해외)의 시트 모델 캐시 제거 (워크북이 바뀐 경우)"""
+        prefix = "국내: " if file_type == "domestic" else "해외: "
+        for key in [k for k in self._model_cache if k.startswith(prefix)]:
+            del self._model_cache[key]
+        for key in [k for k in self._layout_cache if k.startswith(prefix)]:
+            del self._layout_cache[key]
+
+    def _remember_column_widths(self) -> None:
+        """현재 표시 중인 시트의 컬럼 너비를 레이아웃 캐시에 저장"""
+        layout = self._layout_cache.get(self._current_sheet) if self._current_sheet else None
+        table = self.preview_container.get_table()
+        if layout is None or self.proxy is None or table.model() is not self.proxy:
+            return
+        header = table.horizontalHeader()
+        layout[0][:] = [(col, header.sectionSize(col)) for col in range(header.count())]
+
     def on_sheet_changed(self, sheet_name: str):
-        if self.model:
+        if self._saving:
+            return
+        if self.model and self.model.has_pending_edits():
             self.model.apply_dirty_to_sheet()
         self.load_sheet(sheet_name)
         # 시트 변경 시 전처리 버튼 상태 업데이트
         self._update_preprocess_button_state()
 
     # ================= 검색 =================
+    def _on_search_timeout(self):
+        """검색 입력이 멈춘 뒤 현재 검색어로 필터 적용 (저장 중이면 저장 완료 후 적용)"""
+        if self._saving:
+            self._search_deferred = True
+            return
+        self.on_search_changed(self.control_panel.get_search_edit().text())
+
     def on_search_changed(self, text: str):
         if not self.proxy:
             return
-        if not text:
-            self.proxy.setFilterRegularExpression(QRegularExpression(""))
-            return
-        rx = QRegularExpression(
-            QRegularExpression.escape(text),
-            QRegularExpression.CaseInsensitiveOption
-        )
-        self.proxy.setFilterRegularExpression(rx)
+        self.proxy.set_search_text(text)
 
     # ================= 편집 모드 =================
     def on_edit_mode_changed(self):
-        if self.model:
+        if self.model and not self._saving:
             edit_all = self.control_panel.get_edit_all_checkbox().isChecked()
             self.model.set_edit_all(edit_all)
             self.model.layoutChanged.emit()
     
+    # ================= 붙여넣기 =================
+    def on_paste(self):
+        """
+        클립보드의 표 형식 텍스트(탭/줄바꿈 구분)를 현재 셀부터 붙여넣기
+        - 편집 불가 셀은 setData에서 걸러짐
+        - 셀마다 화면을 갱신하지 않고 끝난 뒤 한 번에 갱신
+        """
+        if not self.model or not self.proxy or self._saving:
+            return
+        table = self.preview_container.get_table()
+        start = table.currentIndex()
+        if not start.isValid():
+            return
+        text = QApplication.clipboard().text()
+        if not text:
+            return
+
+        row_count = self.proxy.rowCount()
+        col_count = self.proxy.columnCount()
+        self.model.begin_batch()
+        try:
+            for dr, line in enumerate(text.splitlines()):
+                prow = start.row() + dr
+                if prow >= row_count:
+                    break
+                for dc, value in enumerate(line.split("\t")):
+                    pcol = start.column() + dc
+                    if pcol >= col_count:
+                        break
+                    src_index = self.proxy.mapToSource(self.proxy.index(prow, pcol))
+                    self.model.setData(src_index, value, Qt.EditRole)
+        finally:
+            self.model.end_batch()
+
     # ================= Undo/Redo =================
     def on_undo(self):
         """실행취소 버튼 클릭"""
@@ -479,6 +584,8 @@ class MainPageWidget(QWidget):
 
     # ================= 전처리 =================
     def on_preprocess_clicked(self):
+        if self._saving:
+            return
         # 현재 선택된 시트가 있는지 확인
         sheet_combo = self.control_panel.get_sheet_combo()
         current_sheet = sheet_combo.currentText()
@@ -512,27 +619,37 @@ class MainPageWidget(QWidget):
             QMessageBox.information(self, "안내", "해외 청구서는 이미 전처리되었습니다.")
             return
 
-        if self.model:
-            self.model.apply_dirty_to_sheet()
+        # 작업 중 중복 실행 방지 (완료/실패 시 _update_preprocess_button_state로 복구)
+        self.control_panel.get_preprocess_button().setEnabled(False)
 
         # 로딩 애니메이션 표시
         self.preview_container.show_loading("전처리 중")
-        QApplication.processEvents()
         
         # 모델 잠시 해제 (백그라운드 작업 중 시트 접근 방지)
+        # dirty 반영은 전처리 직전에 백그라운드에서 수행
+        model = self.model
         if self.model:
             self.model = None
-            self.preview_container.get_table().setModel(None)
+            self.preview_container.load_model(None)
         
         # 백그라운드에서 전처리 실행
         company = self.control_panel.get_company_edit().text().strip()
         keyword = self.control_panel.get_search_edit().text().strip()
         
-        self.process_worker = WorkerThread(preprocess_inplace, wb, company=company, keyword=keyword)
+        self.process_worker = WorkerThread(self._run_preprocess, model, wb, company=company, keyword=keyword)
         self.process_worker.finished.connect(lambda _: self._on_preprocess_finished(file_type, current_sheet))
         self.process_worker.error.connect(self._on_worker_error)
         self.process_worker.start()
 
+    @staticmethod
+    def _run_preprocess(model, wb, company: str, keyword: str) -> None:
+        """(백그라운드) 편집 내용을 시트에 반영한 뒤 전처리"""
+        from src.excel_processor import preprocess_inplace
+
+        if model and model.has_pending_edits():
+            model.apply_dirty_to_sheet()
+        preprocess_inplace(wb, company=company, keyword=keyword)
+
     def _on_preprocess_finished(self, file_type, current_sheet):
         """전처리 완료 시 호출되는 콜백"""
         # 전처리 상태 업데이트
@@ -545,7 +662,11 @@ class MainPageWidget(QWidget):
         self._update_preprocess_button_state()
 
         self.info_panel.set_remark("전처리 완료. 미리보기 갱신됨")
+        self.invalidate_company_view()  # Remark 패널을 상태 문구로 덮어썼으므로
         
+        # 전처리로 시트 내용이 바뀌었으므로 캐시된 모델 폐기
+        self._invalidate_model_cache(file_type)
+
         # 시트 다시 로드 (무거운 작업)
         self.load_sheet(current_sheet)
         
@@ -556,6 +677,7 @@ class MainPageWidget(QWidget):
     def _on_worker_error(self, message):
         """작업 도중 에러 발생 시 호출되는 콜백"""
         self.preview_container.hide_loading()
+        self._update_preprocess_button_state()
         QMessageBox.critical(self, "오류", message)
     
     def _update_preprocess_button_state(self):
@@ -590,9 +712,36 @@ class MainPageWidget(QWidget):
 
     # ================= 저장 =================
     def save_as_file(self):
-        # 현재 선택된 시트의 dirty 데이터 저장
-        if self.model:
-            self.model.apply_dirty_to_sheet()
+        if self._saving:
+            return
+        # 불러오기/전처리 워커가 워크북을 쓰는 중이면 끝난 뒤 저장
+        for worker in (getattr(self, "load_worker", None), getattr(self, "process_worker", None)):
+            if worker is not None and worker.isRunning():
+                QMessageBox.information(self, "안내", "작업이 끝난 뒤 다시 저장하세요.")
+                return
+        if not self.wb_domestic and not self.wb_overseas:
+            QMessageBox.information(self, "안내", "먼저 파일을 업로드하세요.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self, "최종 엑셀로 저장", "", "Excel Files (*.xlsx)"
+        )
+        if not path:
+            return
+
+        # dirty 반영 + 시트 병합 + 저장은 백그라운드에서 실행 (대용량 시트에서 UI 멈춤 방지)
+        # - 워커가 워크북을 읽고 쓰는 동안 업로드/전처리/시트 전환/편집 등은 모두 막음
+        self._set_saving(True)
+        self.preview_container.show_loading("저장 중")
+        self.save_worker = WorkerThread(self._build_and_save_workbook, self.model, Path(path))
+        self.save_worker.finished.connect(self._on_save_finished)
+        self.save_worker.error.connect(self._on_save_error)
+        self.save_worker.start()
+
+    def _build_and_save_workbook(self, model, path: Path) -> None:
+        """(백그라운드) 현재 시트의 dirty 반영 후 저장할 워크북을 구성하여 저장"""
+        if model and model.has_pending_edits():
+            model.apply_dirty_to_sheet()
 
         # 저장할 워크북 결정
         if self.wb_domestic and self.wb_overseas:
@@ -616,23 +765,39 @@ class MainPageWidget(QWidget):
             wb_to_save = merged_wb
         elif self.wb_domestic:
             wb_to_save = self.wb_domestic
-        elif self.wb_overseas:
-            wb_to_save = self.wb_overseas
         else:
-            QMessageBox.information(self, "안내", "먼저 파일을 업로드하세요.")
-            return
+            wb_to_save = self.wb_overseas
 
-        path, _ = QFileDialog.getSaveFileName(
-            self, "최종 엑셀로 저장", "", "Excel Files (*.xlsx)"
-        )
-        if not path:
-            return
+        save_workbook_safe(wb_to_save, path)
 
-        try:
-            save_workbook_safe(wb_to_save, Path(path))
-            QMessageBox.information(self, "완료", "저장했습니다.")
-        except AppError as e:
-            QMessageBox.critical(self, "오류", str(e))
+    def _set_saving(self, saving: bool) -> None:
+        """
+        백그라운드 저장 상태 전환
+        - 저장 중: 상단 컨트롤(업로드/전처리/시트/검색/필터/실행취소) 비활성화, 드롭 거부, 모델 잠금
+        - 저장 후: 원래 상태로 되돌리고, 저장 중 미뤄둔 검색 필터를 적용
+        """
+        self._saving = saving
+        self.control_panel.setEnabled(not saving)
+        self.setAcceptDrops(not saving)
+        if self.model:
+            self.model.set_sheet_locked(saving)
+        if not saving:
+            self._update_undo_redo_buttons()
+            if self._search_deferred:
+                self._search_deferred = False
+                self._on_search_timeout()
+
+    def _on_save_finished(self, _):
+        """저장 완료 시 호출되는 콜백"""
+        self.preview_container.hide_loading()
+        self._set_saving(False)
+        QMessageBox.information(self, "완료", "저장했습니다.")
+
+    def _on_save_error(self, message):
+        """저장 실패 시 호출되는 콜백"""
+        self.preview_container.hide_loading()
+        self._set_saving(False)
+        QMessageBox.critical(self, "오류", message)
     
     def _copy_sheet(self, source_sheet, target_sheet):
         """시트 내용 복사 (수식 포함)"""
@@ -669,7 +834,7 @@ class MainPageWidget(QWidget):
 
     # ================= 테이블 헤더 메뉴 =================
     def _on_header_context_menu(self, pos):
-        if not self.proxy or not self.model:
+        if not self.proxy or not self.model or self._saving:
             return
 
         table = self.preview_container.get_table()
@@ -700,6 +865,8 @@ class MainPageWidget(QWidget):
     # ================= 필터 =================
     def on_filter_button_clicked(self):
         """필터 버튼 클릭 시 컬럼 선택 후 필터 다이얼로그 열기"""
+        if self._saving:
+            return
         if not self.model or not self.proxy:
             QMessageBox.information(self, "안내", "먼저 파일을 업로드하세요.")
             return
@@ -717,7 +884,7 @@ class MainPageWidget(QWidget):
     
     def on_clear_filter_clicked(self):
         """필터 해제 버튼 클릭 시 모든 필터 해제"""
-        if not self.proxy:
+        if not self.proxy or self._saving:
             return
         
         self.proxy.clear_all_column_filters()
@@ -752,20 +919,33 @@ class MainPageWidget(QWidget):
             table.setSpan(row, col, row_span, col_span)
     
     # ================= 엑셀 레이아웃 =================
-    def _apply_excel_layout(self, ws):
+    def _apply_excel_layout(self, ws, sheet_display_name: str | None = None):
         table = self.preview_container.get_table()
 
-        for col_idx in range(1, ws.max_column + 1):
-            dim = ws.column_dimensions.get(
-                ExcelSheetModel.excel_col_name(col_idx)
-            )
-            if dim and dim.width:
-                table.setColumnWidth(col_idx - 1, int(dim.width * 7 + 12))
-
-        for row_idx in range(1, ws.max_row + 1):
-            dim = ws.row_dimensions.get(row_idx)
-            if dim and dim.height:
-                table.setRowHeight(row_idx - 1, int(dim.height * 1.33))
+        layout = self._layout_cache.get(sheet_display_name) if sheet_display_name else None
+        if layout is None:
+            col_widths: List[Tuple[int, int]] = []
+            for col_idx in range(1, ws.max_column + 1):
+                dim = ws.column_dimensions.get(
+                    ExcelSheetModel.excel_col_name(col_idx)
+                )
+                if dim and dim.width:
+                    col_widths.append((col_idx - 1, int(dim.width * 7 + 12)))
+
+            row_heights: List[Tuple[int, int]] = []
+            for row_idx in range(1, ws.max_row + 1):
+                dim = ws.row_dimensions.get(row_idx)
+                if dim and dim.height:
+                    row_heights.append((row_idx - 1, int(dim.height * 1.33)))
+
+            layout = (col_widths, row_heights)
+            if sheet_display_name:
+                self._layout_cache[sheet_display_name] = layout
+
+        for col, width in layout[0]:
+            table.setColumnWidth(col, width)
+        for row, height in layout[1]:
+            table.setRowHeight(row, height)
         
         # 병합 셀 처리: setSpan으로 병합 표시
         for mr in ws.merged_cells.ranges:
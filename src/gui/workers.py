@@ -0,0 +1,23 @@
+"""
+백그라운드 작업 쓰레드
+"""
+from PySide6.QtCore import QThread, Signal
+
+
+class WorkerThread(QThread):
+    """긴 작업을 처리할 백그라운드 쓰레드"""
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, task_fn, *args, **kwargs):
+        super().__init__()
+        self.task_fn = task_fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            result = self.task_fn(*self.args, **self.kwargs)
+            self.finished.emit(result)
+        except Exception as e:
+            self.error.emit(str(e))
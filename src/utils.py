@@ -1,7 +1,10 @@
 """
 공통 유틸리티 함수들
 """
+from __future__ import annotations
+
 from datetime import datetime, date, timedelta
+from typing import TYPE_CHECKING
 
 
 def norm(v) -> str:
@@ -133,8 +136,10 @@ def guess_last_data_row(ws, data_start_row: int, anchor_col: int, empty_run: int
     return last_data_row
 
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.workbook.workbook import Workbook
+
+if TYPE_CHECKING:
+    # openpyxl은 실제로 파일을 열 때 import (앱 시작 시간 단축)
+    from openpyxl.workbook.workbook import Workbook
 
 
 class AppError(Exception):
@@ -143,6 +148,8 @@ class AppError(Exception):
 
 
 def load_workbook_safe(path: Path) -> Workbook:
+    from openpyxl import load_workbook
+
     try:
         return load_workbook(path, data_only=False)
     except Exception as e: